@@ -1,11 +1,93 @@
 
 import re
+import heapq
 import logging
+from functools import lru_cache
+from typing import NamedTuple
 
 # Configure basic logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns are compiled once at import time instead of on every call.
+# Follow-up indicators are fused into one alternation (most frequent first)
+# so a question is scanned once rather than once per indicator group.
+_FOLLOWUP_RE = re.compile(
+    r'\b(?:that|it|add|only|same|those|these|them|similar|also|just|but|'
+    r'previous|last|earlier|above|too|additionally|furthermore|except|without|'
+    r'excluding|instead|rather than|compared to|versus|vs|difference|include|'
+    r'show me more|specifically|change|update|modify)\b'
+    r'|\b(?:and|with)\b.*\?$'
+)
+_COND_RE = re.compile(r'\b(greater than|less than|equal to|more than|at least|top|bottom|first|last)\b')
+_NUM_RE = re.compile(r'\b\d+\b')
+# A digit touching a non-space, non-digit char ("top5", "price>100")
+_EMBEDDED_DIGIT_RE = re.compile(r'[^\s\d]\d|\d[^\s\d]')
+_WORD_RE = re.compile(r'\b(\w+)\b')
+
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'what', 'how', 'show', 'me', 'get', 'find'
+})
+
+# Fixed pieces of the history context block
+_FOLLOWUP_HEADER = "\n=== CONVERSATION CONTEXT (Follow-up detected) ==="
+_HISTORY_HEADER = "\n=== RELEVANT CONVERSATION HISTORY ==="
+_CONTEXT_FOOTER = (
+    "\n=== END OF CONTEXT ===\n"
+    "\nIMPORTANT: If the current question refers to 'same', 'those', 'that', etc., "
+    "reuse the relevant SQL filters, tables, and conditions from above.\n"
+)
+
+
+class _Entities(NamedTuple):
+    # Immutable so results can be shared from the lru_cache
+    tables: tuple
+    columns: tuple
+    conditions: tuple
+    numbers: tuple
+
+
+def _extract_numbers(question):
+    # Whitespace-separated numbers can be picked out without the regex engine;
+    # only questions with digits glued to other characters need _NUM_RE
+    if _EMBEDDED_DIGIT_RE.search(question):
+        return tuple(_NUM_RE.findall(question))
+    return tuple(tok for tok in question.split() if tok.isdecimal())
+
+
+@lru_cache(maxsize=512)
+def _extract_entities(question, tables_lower):
+    # Pure function of (question, tables_lower); tables_lower is a hashable
+    # tuple of (table, table.lower()) pairs precomputed by the caller, longest first
+    question_lower = question.lower()
+    lq = len(question_lower)
+    return _Entities(
+        tables=tuple(t for t, tl in tables_lower if len(tl) <= lq and tl in question_lower),
+        columns=(),
+        conditions=tuple(_COND_RE.findall(question_lower)),
+        numbers=_extract_numbers(question),
+    )
+
+
+@lru_cache(maxsize=512)
+def _is_follow_up(question):
+    return _FOLLOWUP_RE.search(question.lower()) is not None
+
+
+@lru_cache(maxsize=256)
+def _sql_tokens(sql_lower):
+    # Identifier-like SQL tokens longer than 3 chars; past SQL repeats across turns
+    return frozenset(t for t in _WORD_RE.findall(sql_lower) if len(t) > 3)
+
+
+def _prep(question, tables_lower):
+    # Lowercase, stop-word-filtered tokens and entities, computed once per question
+    question_lower = question.lower()
+    tokens = frozenset(w for w in question_lower.split() if w not in _STOP_WORDS)
+    return question_lower, tokens, _extract_entities(question, tables_lower)
+
+
 class MockMemory:
     def __init__(self):
         self.messages = []
@@ -17,74 +99,26 @@ class MockMemory:
 class TestSQLService:
     def __init__(self):
         self.allowed_tables = {'footwear_productsin_1'}
-        
-    def _extract_key_entities(self, question):
-        entities = {
-            'tables': [],
-            'columns': [],
-            'conditions': [],
-            'numbers': []
-        }
-        for table in self.allowed_tables:
-            if table.lower() in question.lower():
-                entities['tables'].append(table)
-        numbers = re.findall(r'\b\d+\b', question)
-        entities['numbers'].extend(numbers)
-        conditions = re.findall(r'\b(greater than|less than|equal to|more than|at least|top|bottom|first|last)\b', 
-                           question.lower())
-        entities['conditions'].extend(conditions)
-        return entities
-    
-    def _is_follow_up_question(self, question):
-        follow_up_indicators = [
-            r'\b(same|similar|those|these|that|them|it)\b',
-            r'\b(previous|last|earlier|above)\b',
-            r'\b(also|too|additionally|furthermore)\b',
-            r'\b(but|except|without|excluding)\b',
-            r'\b(instead|rather than)\b',
-            r'\b(compared to|versus|vs|difference)\b',
-            r'\b(add|include|show me more)\b',
-            r'\b(only|just|specifically)\b',
-            r'\b(change|update|modify)\b',
-            r'\b(and|with)\b.*\?$',
-        ]
-        question_lower = question.lower()
-        for pattern in follow_up_indicators:
-            if re.search(pattern, question_lower):
-                return True
-        return False
+        self._allowed_tables_lower = tuple(sorted(
+            ((t, t.lower()) for t in self.allowed_tables), key=lambda x: -len(x[1])
+        ))
     
-    def _calculate_relevance_score(self, current_question, past_question, past_sql):
+    def _calculate_relevance_score(self, cur_prep, past_prep, past_sql):
+        # cur_prep / past_prep are (lowered, tokens, entities) tuples from _prep()
         score = 0.0
-        current_lower = current_question.lower()
-        past_lower = past_question.lower()
-        
-        current_entities = self._extract_key_entities(current_question)
-        past_entities = self._extract_key_entities(past_question)
+        _, current_tokens, current_entities = cur_prep
+        _, past_tokens, past_entities = past_prep
         
-        shared_tables = set(current_entities['tables']) & set(past_entities['tables'])
+        shared_tables = set(current_entities.tables) & set(past_entities.tables)
         if shared_tables:
-            score += 0.4 * min(len(shared_tables) / max(len(current_entities['tables']), 1), 1.0)
+            score += 0.4 * min(len(shared_tables) / max(len(current_entities.tables), 1), 1.0)
         
-        current_words = set(current_lower.split())
-        past_words = set(past_lower.split())
-        stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-                     'of', 'with', 'by', 'from', 'what', 'how', 'show', 'me', 'get', 'find'}
-        current_words = current_words - stop_words
-        past_words = past_words - stop_words
-        
-        if current_words and past_words:
-            overlap = len(current_words & past_words) / len(current_words | past_words)
+        if current_tokens and past_tokens:
+            overlap = len(current_tokens & past_tokens) / len(current_tokens | past_tokens)
             score += 0.3 * overlap
         
         if past_sql:
-            sql_lower = past_sql.lower()
-            sql_entities = re.findall(r'\b(\w+)\b', sql_lower)
-            current_mentions_sql_entity = any(
-                entity in current_lower for entity in sql_entities 
-                if len(entity) > 3
-            )
-            if current_mentions_sql_entity:
+            if not current_tokens.isdisjoint(_sql_tokens(past_sql.lower())):
                 score += 0.3
         
         return min(score, 1.0)
@@ -93,8 +127,9 @@ class TestSQLService:
         if not memory:
             return ""
         
-        is_follow_up = self._is_follow_up_question(current_question)
-        print(f"DEBUG: Is follow up? {is_follow_up}")
+        is_follow_up = _is_follow_up(current_question)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Is follow up? %s", is_follow_up)
         
         n_messages = 10 if is_follow_up else 6
         recent = memory.get_recent_history(n=n_messages)
@@ -102,6 +137,8 @@ class TestSQLService:
         if not recent:
             return ""
         
+        cur_prep = _prep(current_question, self._allowed_tables_lower)
+        
         scored_messages = []
         for i in range(0, len(recent), 2):
             if i + 1 >= len(recent):
@@ -118,45 +155,35 @@ class TestSQLService:
             past_sql = assistant_msg.get('metadata', {}).get('sql')
             past_row_count = assistant_msg.get('metadata', {}).get('row_count', 0)
             
-            relevance = self._calculate_relevance_score(
-                current_question, past_question, past_sql
-            )
-            print(f"DEBUG: Msg '{past_question}' Relevance: {relevance}")
+            past_prep = _prep(past_question, self._allowed_tables_lower)
+            relevance = self._calculate_relevance_score(cur_prep, past_prep, past_sql)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Msg '%s' Relevance: %s", past_question, relevance)
             
             if is_follow_up or relevance > 0.2:
-                scored_messages.append({
-                    'question': past_question,
-                    'answer': past_answer,
-                    'sql': past_sql,
-                    'row_count': past_row_count,
-                    'relevance': relevance,
-                    'index': i // 2
-                })
+                # (relevance, index, question, answer, sql, row_count)
+                scored_messages.append((
+                    relevance, i // 2, past_question, past_answer, past_sql, past_row_count
+                ))
         
         if not scored_messages:
             return ""
         
-        scored_messages.sort(key=lambda x: (-x['relevance'], -x['index']))
+        # Top-k by relevance (ties favour newer messages), then chronological
         max_context_pairs = 3 if is_follow_up else 2
-        relevant_messages = scored_messages[:max_context_pairs]
-        relevant_messages.sort(key=lambda x: x['index'])
-        
-        context_parts = []
-        if is_follow_up:
-            context_parts.append("\n=== CONVERSATION CONTEXT (Follow-up detected) ===")
-        else:
-            context_parts.append("\n=== RELEVANT CONVERSATION HISTORY ===")
-        
-        for idx, msg in enumerate(relevant_messages, 1):
-            context_parts.append(f"\n[Q{idx}] {msg['question']}")
-            if msg['sql']:
-                context_parts.append(f"   [SQL Used: {msg['sql']}]")
-            context_parts.append(f"[A{idx}] {msg['answer'][:50]}...")
-            
-        context_parts.append("\n=== END OF CONTEXT ===")
-        context_parts.append("\nIMPORTANT: If the current question refers to 'same', 'those', 'that', etc., reuse the relevant SQL filters, tables, and conditions from above.\n")
-        
-        return "\n".join(context_parts)
+        relevant_messages = heapq.nlargest(
+            max_context_pairs, scored_messages, key=lambda m: (m[0], m[1])
+        )
+        relevant_messages.sort(key=lambda m: m[1])
+        
+        header = _FOLLOWUP_HEADER if is_follow_up else _HISTORY_HEADER
+        body = "\n".join(
+            f"\n[Q{idx}] {question}"
+            + (f"\n   [SQL Used: {sql}]" if sql else "")
+            + f"\n[A{idx}] {answer[:50]}..."
+            for idx, (_, _, question, answer, sql, _) in enumerate(relevant_messages, 1)
+        )
+        return f"{header}\n{body}\n{_CONTEXT_FOOTER}"
 
 def test_logic():
     print("--- Testing Logic Safely ---")
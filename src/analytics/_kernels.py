@@ -0,0 +1,46 @@
+"""
+Numeric kernels for large result sets.
+
+Numba is optional: when it is not installed, `reduce_stats` is None and
+callers fall back to NumPy reductions.
+"""
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+# Below this many values the JIT call overhead outweighs the fused pass
+JIT_MIN_VALUES = 5_000
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def reduce_stats(a):
+        """
+        Single pass over a float64 or int64 array using Welford's algorithm.
+        
+        Returns:
+            (argmin, argmax, sum, mean, m2) where the sample variance
+            is m2 / (n - 1). argmin/argmax are exact for either dtype;
+            sum and mean are always accumulated as floats, so integer
+            callers take the exact sum from the original values.
+        """
+        n = a.shape[0]
+        imn = 0
+        imx = 0
+        s = 0.0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n):
+            v = a[i]
+            s += v
+            if v < a[imn]:
+                imn = i
+            if v > a[imx]:
+                imx = i
+            delta = v - mean
+            mean += delta / (i + 1)
+            m2 += delta * (v - mean)
+        return imn, imx, s, mean, m2
+else:
+    reduce_stats = None
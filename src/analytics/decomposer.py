@@ -5,6 +5,7 @@ This service is responsible for breaking down complex user queries into
 independent sub-questions that can be executed separately.
 """
 import json
+import re
 from typing import List
 
 from src.core.logging_config import get_logger
@@ -17,6 +18,14 @@ from src.llm.prompts.decomposition import (
 
 logger = get_logger(__name__)
 
+# Rule-based split on '?', ';' and ' and then ', compiled once at import
+_SPLIT_RE = re.compile(r'\?|;| and then ', re.IGNORECASE)
+
+# Prefixes of simple single-table lookups that skip decomposition
+_SIMPLE_PREFIXES = (
+    "show me", "list", "get", "what are", "count", "how many", "find"
+)
+
 
 class QueryDecomposer:
     """
@@ -47,13 +56,10 @@ class QueryDecomposer:
         # If the question is a simple lookup, skip the LLM optimization step to save time (1-3s)
         # and prevent "Double Answer" issues where the LLM invents a context step.
         lower_q = question.strip().lower()
-        simple_indicators = [
-            "show me", "list", "get", "what are", "count", "how many", "find"
-        ]
         
         # Check if it looks like a single-table filter request
         # e.g. "Show me nike shoes", "List all products"
-        is_simple = any(lower_q.startswith(ind) for ind in simple_indicators)
+        is_simple = lower_q.startswith(_SIMPLE_PREFIXES)
         has_complex_joins = " and " in lower_q and " then " in lower_q # "Do X and THEN do Y"
         has_multistep_delimiters = "?" in lower_q or ";" in lower_q
         
@@ -66,21 +72,17 @@ class QueryDecomposer:
         # The user requested to disable the LLM here to save tokens.
         # We split by common delimiters: '?', ';', ' and then '
         
-        import re
-        
         # 1. Normalize delimiters to a common one (e.g., <SPLIT>)
         # Regex explanation:
         # \? -> Literal question mark
         # ; -> Literal semicolon
         # \s+and\s+then\s+ -> " and then " (case insensitive handled by .lower() earlier, but let's be safe)
         
-        split_pattern = r'\?|;| and then '
-        
         # split() will remove the delimiters, so we might lose the '?' at the end.
         # That's fine for SQL generation, but if we want to preserve it, we'd need capture groups.
         # For now, simple split is sufficient.
         
-        parts = re.split(split_pattern, question, flags=re.IGNORECASE)
+        parts = _SPLIT_RE.split(question)
         
         # Filter empty strings and strip whitespace
         questions = [p.strip() for p in parts if p.strip()]
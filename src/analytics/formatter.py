@@ -15,6 +15,13 @@ from src.core.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _format_float(value: float) -> str:
+    """Format floats nicely: whole numbers without decimals, else 2 places."""
+    if value.is_integer():
+        return str(int(value))
+    return f"{value:.2f}"
+
+
 class ResultFormatter:
     """
     Formats query results into various display formats.
@@ -41,6 +48,14 @@ class ResultFormatter:
         """
         self.max_rows = max_rows
         self.max_col_width = max_col_width
+        
+        # Per-type formatters for _format_value (exact type match)
+        self._formatters = {
+            type(None): lambda value: "_null_",
+            int: str,
+            float: _format_float,
+            str: self._format_str,
+        }
     
     def format_as_table(self, data: List[Dict[str, Any]]) -> str:
         """
@@ -56,29 +71,24 @@ class ResultFormatter:
             return "_No data to display_"
         
         # Get column headers from first row
-        headers = list(data[0].keys())
+        headers = tuple(data[0])
         
         if not headers:
             return "_No columns in data_"
         
-        # Limit rows
-        display_data = data[:self.max_rows]
-        
         # Build header row
         header_row = "| " + " | ".join(headers) + " |"
-        separator = "|" + "|".join(["---" for _ in headers]) + "|"
+        separator = "|" + "|".join("---" for _ in headers) + "|"
         
-        # Build data rows
-        rows = []
-        for row in display_data:
-            values = []
-            for header in headers:
-                value = self._format_value(row.get(header, ""))
-                values.append(value)
-            rows.append("| " + " | ".join(values) + " |")
+        # Build data rows (limited to max_rows), one joined string per row
+        format_value = self._format_value
+        rows = [
+            "| " + " | ".join(format_value(row.get(h, "")) for h in headers) + " |"
+            for row in data[:self.max_rows]
+        ]
         
         # Add truncation notice if needed
-        table = "\n".join([header_row, separator] + rows)
+        table = "\n".join((header_row, separator, *rows))
         
         if len(data) > self.max_rows:
             table += f"\n\n_Showing {self.max_rows} of {len(data)} rows_"
@@ -179,7 +189,7 @@ class ResultFormatter:
             return "summary"
         
         row_count = len(data)
-        col_count = len(data[0].keys()) if data else 0
+        col_count = len(data[0])
         
         # Single row with few columns - summary
         if row_count == 1:
@@ -202,6 +212,10 @@ class ResultFormatter:
         Returns:
             Formatted string
         """
+        # Handle empty results once here instead of in each formatter
+        if not data:
+            return "_No data_"
+        
         format_type = self.detect_best_format(data)
         
         if format_type == "summary":
@@ -213,20 +227,23 @@ class ResultFormatter:
     
     def _format_value(self, value: Any) -> str:
         """Format a single value for display."""
-        if value is None:
-            return "_null_"
+        formatter = self._formatters.get(type(value))
+        if formatter is not None:
+            return formatter(value)
         
+        # Subclasses such as numpy.float64 still get float formatting
         if isinstance(value, float):
-            # Format floats nicely
-            if value == int(value):
-                return str(int(value))
-            return f"{value:.2f}"
-        
-        str_value = str(value)
+            return _format_float(value)
         
+        return self._format_str(str(value))
+    
+    def _format_str(self, str_value: str) -> str:
+        """Truncate long strings and escape pipes for markdown."""
         # Truncate long strings
         if len(str_value) > self.max_col_width:
             return str_value[:self.max_col_width - 3] + "..."
         
         # Escape pipe characters for markdown
-        return str_value.replace("|", "\\|")
+        if "|" in str_value:
+            return str_value.replace("|", "\\|")
+        return str_value
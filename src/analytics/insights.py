@@ -8,17 +8,48 @@ This module analyzes query results and generates:
 
 These insights are provided to the LLM for better answers.
 """
+import hashlib
+import heapq
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
-from statistics import mean, median, stdev
-from collections import Counter
+
+import numpy as np
+import orjson
 
 from src.core.logging_config import get_logger
 from src.core.config import get_settings
 from src.llm.client import LLMClient
 from src.llm.prompts.analysis_prompts import DEEP_MODE_SYSTEM_PROMPT
+from src.analytics._kernels import reduce_stats, JIT_MIN_VALUES
 
 logger = get_logger(__name__)
 
+# Maximum number of AI insight responses kept in memory per generator
+AI_CACHE_MAX_ENTRIES = 256
+
+# Numeric columns are analyzed in parallel only for wide, large result sets;
+# below this the thread overhead outweighs the GIL-free NumPy reductions
+PARALLEL_MIN_COLUMNS = 4
+PARALLEL_MIN_ROWS = 10_000
+PARALLEL_MAX_WORKERS = 4
+
+
+def _median(arr: np.ndarray, nums: List[Any]) -> Any:
+    """
+    Median typed like round(statistics.median(nums), 2).
+    
+    The middle value(s) are picked from the original Python numbers, so an
+    odd count keeps the element's own type (ints stay ints) and an even
+    count averages the two exact middle values.
+    """
+    n = len(nums)
+    k = n // 2
+    if n % 2:
+        return round(nums[int(np.argpartition(arr, k)[k])], 2)
+    idx = np.argpartition(arr, (k - 1, k))
+    return round((nums[int(idx[k - 1])] + nums[int(idx[k])]) / 2, 2)
+
 
 class InsightsGenerator:
     """
@@ -39,6 +70,8 @@ class InsightsGenerator:
         """Initialize with LLM client."""
         self.settings = get_settings()
         self.llm = LLMClient()
+        # Prompt hash -> LLM response, so repeated result sets skip the LLM call
+        self._ai_cache: Dict[str, str] = {}
         logger.info("InsightsGenerator initialized")
     
     def generate_insights(
@@ -72,28 +105,49 @@ class InsightsGenerator:
             "insight_type": "simple"  # Default to simple
         }
         
-        # Analyze each column
+        # Single pass over the rows: collect non-null values for every column
+        # and remember the row holding each column's largest numeric value
         columns = list(data[0].keys())
+        column_values = {col: [] for col in columns}
+        max_values: Dict[str, Any] = {}
+        max_index: Dict[str, int] = {}
+        for i, row in enumerate(data):
+            for col, bucket in column_values.items():
+                value = row.get(col)
+                if value is None:
+                    continue
+                bucket.append(value)
+                if isinstance(value, (int, float)) and (
+                    col not in max_values or value > max_values[col]
+                ):
+                    max_values[col] = value
+                    max_index[col] = i
         
-        for col in columns:
-            values = [row.get(col) for row in data if row.get(col) is not None]
-            
-            if not values:
-                continue
-            
-            col_type = self._detect_column_type(values)
+        # Classify columns, then compute numeric stats (possibly in parallel)
+        column_types = {
+            col: self._detect_column_type(values)
+            for col, values in column_values.items()
+            if values
+        }
+        numeric_stats = self._analyze_numeric_columns(
+            [col for col, col_type in column_types.items() if col_type == "numeric"],
+            column_values,
+            len(data)
+        )
+        
+        # Analyze each column
+        for col, col_type in column_types.items():
+            values = column_values[col]
             insights["column_types"][col] = col_type
             
             if col_type == "numeric":
-                stats = self._analyze_numeric(values)
-                insights["numeric_stats"][col] = stats
+                insights["numeric_stats"][col] = numeric_stats[col]
                 
                 # Track top value for numeric columns
-                if data:
-                    max_row = max(data, key=lambda r: r.get(col, 0) if isinstance(r.get(col), (int, float)) else 0)
+                if col in max_values:
                     insights["top_values"][col] = {
-                        "value": max_row.get(col),
-                        "row": max_row
+                        "value": max_values[col],
+                        "row": data[max_index[col]]
                     }
             
             elif col_type == "text":
@@ -120,13 +174,53 @@ class InsightsGenerator:
         return insights
     
     def _detect_column_type(self, values: List[Any]) -> str:
-        """Detect if a column is numeric or text."""
-        numeric_count = sum(1 for v in values if isinstance(v, (int, float)))
+        """Detect if a column is numeric or text (more than 80% numeric values)."""
+        n = len(values)
+        threshold = n * 0.8
+        numeric_count = 0
+        
+        # Stop as soon as the verdict can no longer change
+        for i, v in enumerate(values):
+            if isinstance(v, (int, float)):
+                numeric_count += 1
+                if numeric_count > threshold:
+                    return "numeric"
+            elif numeric_count + (n - i - 1) <= threshold:
+                return "text"
         
-        if numeric_count > len(values) * 0.8:
-            return "numeric"
         return "text"
     
+    def _analyze_numeric_columns(
+        self,
+        columns: List[str],
+        column_values: Dict[str, List[Any]],
+        row_count: int
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run _analyze_numeric for each numeric column.
+        
+        Wide, large result sets are spread over a small thread pool since
+        NumPy releases the GIL during reductions.
+        
+        Args:
+            columns: Numeric column names
+            column_values: Non-null values per column
+            row_count: Number of rows in the result set
+            
+        Returns:
+            Dictionary mapping column name to its statistics
+        """
+        if len(columns) >= PARALLEL_MIN_COLUMNS and row_count >= PARALLEL_MIN_ROWS:
+            workers = min(PARALLEL_MAX_WORKERS, len(columns))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    pool.submit(self._analyze_numeric, column_values[col]): col
+                    for col in columns
+                }
+                return {futures[f]: f.result() for f in as_completed(futures)}
+        
+        return {col: self._analyze_numeric(column_values[col]) for col in columns}
+    
     def _analyze_numeric(self, values: List[Any]) -> Dict[str, Any]:
         """
         Calculate statistics for numeric values.
@@ -137,30 +231,70 @@ class InsightsGenerator:
         Returns:
             Dictionary with min, max, avg, sum, etc.
         """
-        # Filter to only numeric values
-        nums = [v for v in values if isinstance(v, (int, float))]
+        n = sum(1 for v in values if isinstance(v, (int, float)))
         
-        if not nums:
+        if not n:
             return {}
         
-        stats = {
-            "min": min(nums),
-            "max": max(nums),
-            "avg": round(mean(nums), 2),
-            "sum": round(sum(nums), 2),
-            "count": len(nums)
-        }
-        
-        # Add median if enough values
-        if len(nums) >= 3:
-            stats["median"] = round(median(nums), 2)
+        # Only mixed columns need a filtered copy; positions in `nums` line up
+        # with the array, so min/max keep their original Python type
+        if n == len(values):
+            nums = values
+        else:
+            nums = [v for v in values if isinstance(v, (int, float))]
         
-        # Add standard deviation if enough values
-        if len(nums) >= 3:
+        # Integer columns reduce over int64 (exact argmin/argmax beyond 2**53);
+        # anything else, or ints too large for int64, over float64. Arrays are
+        # sized up front so np.fromiter never has to resize.
+        integral = all(isinstance(v, int) for v in nums)
+        arr = None
+        if integral:
             try:
-                stats["std_dev"] = round(stdev(nums), 2)
-            except:
+                arr = np.fromiter(nums, dtype=np.int64, count=n)
+            except OverflowError:
                 pass
+        if arr is None:
+            arr = np.fromiter(nums, dtype=np.float64, count=n)
+        
+        if reduce_stats is not None and n >= JIT_MIN_VALUES:
+            # Large columns: one fused JIT pass instead of separate reductions
+            imn, imx, total, avg, m2 = reduce_stats(arr)
+            std = (m2 / (n - 1)) ** 0.5
+        else:
+            imn, imx = int(arr.argmin()), int(arr.argmax())
+            total, avg = arr.sum(), arr.mean()
+            std = arr.std(ddof=1) if n >= 3 else None
+        
+        if integral:
+            # Keep the integer results plain-Python statistics gave: an exact
+            # int sum, and an int avg whenever it is a whole number. The float
+            # sum/mean from either reduction path are not used here.
+            total = sum(nums)
+            avg = total // n if total % n == 0 else round(total / n, 2)
+            if n >= 3:
+                std = round(float(std), 2)
+        elif n >= 3:
+            # Round all derived float statistics in one vectorized call
+            avg, total, std = np.round(np.array([avg, total, std]), 2).tolist()
+        else:
+            avg, total = np.round(np.array([avg, total]), 2).tolist()
+        
+        if n >= 3:
+            med = _median(arr, nums)
+        
+        stats = {
+            # Index back into nums so min/max keep their original Python type
+            "min": nums[int(imn)],
+            "max": nums[int(imx)],
+            "avg": avg,
+            "sum": total,
+            "count": n
+        }
+        
+        # Add median and standard deviation (sample, like statistics.stdev) if enough values
+        if n >= 3:
+            stats["median"] = med
+            stats["std_dev"] = std
         
         return stats
     
@@ -184,11 +318,19 @@ class InsightsGenerator:
         if not values:
             return {"unique_count": 0, "top_values": []}
         
-        counter = Counter(values)
+        # Plain dict counts; unhashable values (e.g. JSON lists/dicts) are
+        # counted by their repr instead of raising TypeError
+        counts: Dict[Any, int] = {}
+        for v in values:
+            try:
+                counts[v] = counts.get(v, 0) + 1
+            except TypeError:
+                key = repr(v)
+                counts[key] = counts.get(key, 0) + 1
         
         return {
-            "unique_count": len(counter),
-            "top_values": counter.most_common(5),
+            "unique_count": len(counts),
+            "top_values": heapq.nlargest(5, counts.items(), key=itemgetter(1)),
             "total_count": len(values)
         }
     
@@ -209,7 +351,13 @@ class InsightsGenerator:
                 "top_values": stats.get("top_values", {}),
                 "column_types": stats.get("column_types", {})
             }
-            stats_summary = str(stats_context)
+            # Compact JSON is cheaper to build than str() and uses fewer prompt
+            # tokens; default=str covers Decimal and other non-JSON DB types
+            stats_summary = orjson.dumps(
+                stats_context,
+                default=str,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            ).decode()
             
             prompt = f"""
             Analyze the following statistical metrics.
@@ -223,13 +371,25 @@ class InsightsGenerator:
             Write the Executive Brief.
             """
             
+            cache_key = hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+            cached = self._ai_cache.get(cache_key)
+            if cached is not None:
+                logger.debug("AI insights cache hit")
+                return cached
+            
             response = self.llm.generate(
                 user_message=prompt,
                 system_prompt=DEEP_MODE_SYSTEM_PROMPT,
                 model=self.settings.llm_model_analysis
             )
+            text = response.strip()
+            
+            # Evict the oldest entry once full (dicts keep insertion order)
+            if len(self._ai_cache) >= AI_CACHE_MAX_ENTRIES:
+                self._ai_cache.pop(next(iter(self._ai_cache)))
+            self._ai_cache[cache_key] = text
             
-            return response.strip()
+            return text
             
         except Exception as e:
             logger.error(f"Failed to generate AI insights: {e}")
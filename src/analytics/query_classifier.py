@@ -11,6 +11,7 @@ This module analyzes SQL queries to classify them into categories:
 The classification helps format responses appropriately.
 """
 import re
+from functools import lru_cache
 from typing import Optional
 from enum import Enum
 
@@ -29,6 +30,60 @@ class QueryType(str, Enum):
     UNKNOWN = "unknown"
 
 
+# All classification patterns fused into one alternation so a query is
+# scanned once. The ranking branch is a lookahead so it does not consume
+# (and hide) aggregates or LIMIT clauses that follow ORDER BY. SQL keywords
+# are ASCII, so re.ASCII keeps \b, \s and \d off the Unicode tables.
+_COMBINED_PATTERN = re.compile(
+    r'(?P<agg>\b(?:COUNT|SUM|AVG|MIN|MAX)\s*\()'
+    r'|(?P<grp>\bGROUP\s+BY\b)'
+    r'|(?P<ord>ORDER\s+BY\s+(?=.+\s+(?:DESC|ASC)))'
+    r'|(?P<lim>\bLIMIT\s+(?P<limit>\d+))'
+    r'|(?P<whr>\bWHERE\b)',
+    re.IGNORECASE | re.ASCII
+)
+
+
+@lru_cache(maxsize=2048)
+def _classify_cached(sql: str) -> QueryType:
+    """Classify a non-empty SQL string (pure, so results are memoized)."""
+    found = {"agg": False, "grp": False, "ord": False, "whr": False}
+    limit_val = None
+    
+    for match in _COMBINED_PATTERN.finditer(sql):
+        kind = match.lastgroup
+        if kind == "lim":
+            # Only the first LIMIT counts
+            if limit_val is None:
+                limit_val = int(match.group("limit"))
+        else:
+            found[kind] = True
+    
+    # Pure aggregation without GROUP BY
+    if found["agg"] and not found["grp"]:
+        return QueryType.AGGREGATION
+    
+    # Check for GROUP BY (distribution query)
+    if found["grp"]:
+        return QueryType.DISTRIBUTION
+    
+    # Check for ranking (ORDER BY with small LIMIT)
+    if found["ord"] and limit_val is not None and limit_val <= 20:
+        return QueryType.RANKING
+    
+    # Check for comparison (WHERE clause)
+    if found["whr"]:
+        return QueryType.COMPARISON
+    
+    # Default to lookup
+    return QueryType.LOOKUP
+
+
+def clear_classification_cache() -> None:
+    """Drop memoized classifications, e.g. between tests."""
+    _classify_cached.cache_clear()
+
+
 class QueryClassifier:
     """
     Classifies SQL queries by their intent.
@@ -44,28 +99,6 @@ class QueryClassifier:
         QueryType.RANKING
     """
     
-    # Regex patterns for classification
-    AGGREGATION_PATTERN = re.compile(
-        r'\b(COUNT|SUM|AVG|MIN|MAX)\s*\(',
-        re.IGNORECASE
-    )
-    RANKING_PATTERN = re.compile(
-        r'ORDER\s+BY\s+.+\s+(DESC|ASC)',
-        re.IGNORECASE
-    )
-    DISTRIBUTION_PATTERN = re.compile(
-        r'\bGROUP\s+BY\b',
-        re.IGNORECASE
-    )
-    LIMIT_PATTERN = re.compile(
-        r'\bLIMIT\s+(\d+)',
-        re.IGNORECASE
-    )
-    WHERE_PATTERN = re.compile(
-        r'\bWHERE\b',
-        re.IGNORECASE
-    )
-    
     def classify(self, sql: str) -> QueryType:
         """
         Classify a SQL query by its type.
@@ -78,33 +111,7 @@ class QueryClassifier:
         """
         if not sql:
             return QueryType.UNKNOWN
-        
-        sql_upper = sql.upper()
-        
-        # Check for aggregation functions
-        if self.AGGREGATION_PATTERN.search(sql):
-            # Pure aggregation without GROUP BY
-            if not self.DISTRIBUTION_PATTERN.search(sql):
-                return QueryType.AGGREGATION
-        
-        # Check for GROUP BY (distribution query)
-        if self.DISTRIBUTION_PATTERN.search(sql):
-            return QueryType.DISTRIBUTION
-        
-        # Check for ranking (ORDER BY with small LIMIT)
-        if self.RANKING_PATTERN.search(sql):
-            limit_match = self.LIMIT_PATTERN.search(sql)
-            if limit_match:
-                limit_val = int(limit_match.group(1))
-                if limit_val <= 20:
-                    return QueryType.RANKING
-        
-        # Check for comparison (WHERE clause)
-        if self.WHERE_PATTERN.search(sql):
-            return QueryType.COMPARISON
-        
-        # Default to lookup
-        return QueryType.LOOKUP
+        return _classify_cached(sql)
     
     def get_format_hint(self, query_type: QueryType) -> str:
         """
@@ -3,51 +3,139 @@ Visualization Service using Plotly.
 
 Automatically generates interactive charts based on data structure.
 """
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from typing import List, Dict, Any, Optional
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+import orjson
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
+
+# pandas/plotly are imported on first chart build to keep them out of
+# cold start for processes that never render a chart
+_pd = None
+_px = None
+
+
+def _chart_modules():
+    """Import pandas and plotly.express once, on first use."""
+    global _pd, _px
+    if _px is None:
+        import pandas
+        import plotly.express
+        _pd = pandas
+        _px = plotly.express
+    return _pd, _px
+
+
+# LRU cache of built charts keyed by a fingerprint of the input rows.
+# Entries are figure dicts (or None when no chart fits); every hit builds a
+# fresh go.Figure, so callers can restyle what they get back freely.
+CHART_CACHE_MAX_ENTRIES = 128
+_CHART_CACHE: "OrderedDict[str, Optional[Dict[str, Any]]]" = OrderedDict()
+_CHART_CACHE_LOCK = threading.Lock()
+
+# Column-name keyword checks (case-insensitive substring matches)
+_SKIP_RE = re.compile(r"name|description", re.IGNORECASE)  # text, never numeric
+_ID_RE = re.compile(r"id", re.IGNORECASE)                  # identifiers, e.g. ProductId
+_TIME_RE = re.compile(r"date|year", re.IGNORECASE)         # time axis candidates
+
+def _to_numeric_if_clean(series: "pd.Series") -> "pd.Series":
+    """Return the column as numeric if all non-null values parse, else unchanged."""
+    pd, _ = _chart_modules()
+    try:
+        converted = pd.to_numeric(series, errors="coerce")
+    except (TypeError, ValueError):
+        return series
+    if (converted.isna() & series.notna()).any():
+        return series
+    return converted
+
 
 class Visualizer:
     """Generates Plotly charts from data."""
     
     @staticmethod
-    def create_chart(data: List[Dict[str, Any]]) -> Optional[go.Figure]:
+    def create_chart(data: List[Dict[str, Any]]) -> Optional["go.Figure"]:
         """
         Analyze data and create the most appropriate chart.
         Returns None if no suitable chart can be created.
+        
+        Results are cached by data fingerprint, so re-rendering the same
+        result set (e.g. on a UI rerun) skips DataFrame building and chart
+        selection. Each call returns its own figure.
         """
         if not data or len(data) < 2:
             return None
-            
+        
+        try:
+            key = hashlib.blake2b(
+                orjson.dumps(
+                    data,
+                    default=str,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ),
+                digest_size=16
+            ).hexdigest()
+        except (TypeError, orjson.JSONEncodeError):
+            # Not fingerprintable; build without caching
+            return Visualizer._build_chart(data)
+        
+        with _CHART_CACHE_LOCK:
+            hit = key in _CHART_CACHE
+            if hit:
+                _CHART_CACHE.move_to_end(key)
+                cached = _CHART_CACHE[key]
+        
+        if hit:
+            if cached is None:
+                return None
+            import plotly.graph_objects as go
+            return go.Figure(cached)
+        
+        fig = Visualizer._build_chart(data)
+        
+        with _CHART_CACHE_LOCK:
+            # to_dict() deep-copies, so later changes to `fig` don't leak in
+            _CHART_CACHE[key] = fig.to_dict() if fig is not None else None
+            if len(_CHART_CACHE) > CHART_CACHE_MAX_ENTRIES:
+                _CHART_CACHE.popitem(last=False)
+        
+        return fig
+    
+    @staticmethod
+    def _build_chart(data: List[Dict[str, Any]]) -> Optional["go.Figure"]:
+        """Build the chart for `data` (uncached)."""
+        pd, px = _chart_modules()
         try:
             df = pd.DataFrame(data)
             
-            # CLEANING: Try to convert object columns to numeric if possible
-            for col in df.columns:
-                # Skip explicit text columns like names
-                if "name" in col.lower() or "description" in col.lower():
-                    continue
-                try:
-                    df[col] = pd.to_numeric(df[col])
-                except:
-                    pass
+            # CLEANING: Convert columns to numeric where every value parses,
+            # skipping explicit text columns like names
+            convertible = ~df.columns.str.contains(_SKIP_RE)
+            if convertible.any():
+                cols = df.columns[convertible]
+                df[cols] = df[cols].apply(_to_numeric_if_clean)
             
-            # Identify columns
+            # Identify columns from a single dtypes pass
             # Exclude IDs from being treated as meaningful numerics
+            kinds = df.dtypes.map(lambda dtype: dtype.kind)
             numeric_cols = [
-                c for c in df.select_dtypes(include=['number']).columns 
-                if 'id' not in c.lower()
+                c for c, kind in kinds.items()
+                if kind in "iufc" and not _ID_RE.search(c)
             ]
             
-            categorical_cols = df.select_dtypes(include=['object', 'category', 'string']).columns.tolist()
+            categorical_cols = [c for c, kind in kinds.items() if kind == "O"]
             
             # Fallback: If no categorical, treat 'id' or first column as label
             if not categorical_cols and len(df.columns) > 0:
                 categorical_cols = [df.columns[0]]
 
             # Case 1: Time Series (Line Chart)
-            time_cols = [c for c in df.columns if 'date' in c.lower() or 'year' in c.lower()]
+            time_cols = [c for c in df.columns if _TIME_RE.search(c)]
             if time_cols and numeric_cols:
                 time = time_cols[0]
                 num = numeric_cols[0]
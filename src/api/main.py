@@ -12,10 +12,11 @@ It handles:
 Run with: uvicorn src.api.main:app --reload
 """
 from contextlib import asynccontextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 
+import anyio.to_thread
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.core.config import get_settings
@@ -26,8 +27,10 @@ from src.core.exceptions import (
     ValidationError,
     DatabaseError,
 )
-from src.core.audit import AuditMiddleware, SecurityHeadersMiddleware
+from src.core.audit import AuditMiddleware, SecurityHeadersMiddleware, DEFAULT_SKIP_PATHS
+from src.core.body_limit import BodySizeLimitMiddleware
 from src.api.routes import chat_router, health_router, database_router, session_router, connection_router
+from src.api.routes.chat import get_chat_service
 from src.models.chat import ErrorResponse
 
 
@@ -36,6 +39,14 @@ settings = get_settings()
 setup_logging(settings.log_level)
 logger = get_logger(__name__)
 
+# Settings are immutable, so evaluate these once rather than per request
+_IS_DEV = settings.is_development()
+_AUDIT = settings.enable_audit_logging
+
+# Worker threads for sync (def) routes; long CSV loads and DB calls should not
+# starve the default 40-thread pool
+THREADPOOL_SIZE = 100
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -52,6 +63,15 @@ async def lifespan(app: FastAPI):
     logger.info(f"Rate Limit: {settings.rate_limit_per_minute} req/min")
     logger.info(f"Audit Logging: {settings.enable_audit_logging}")
     
+    # Blocking routes run in anyio's threadpool; raise its capacity
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    
+    # Create the chat service up front so the first request doesn't pay for it
+    try:
+        get_chat_service()
+    except Exception as e:
+        logger.error(f"Failed to initialize chat service: {e}")
+    
     # Initialize persistent memory tables (if enabled)
     # This ensures tables exist in Cloud DB on fresh deploy
     if settings.memory_persistent:
@@ -101,6 +121,7 @@ app = FastAPI(
     """,
     version="0.8.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -110,16 +131,19 @@ app = FastAPI(
 # Middleware Configuration (Order matters!)
 # ============================================================
 
+# Upload size limit, enforced before the multipart body is parsed
+app.add_middleware(BodySizeLimitMiddleware, max_bytes=settings.max_upload_bytes)
+
 # Security headers middleware (Phase 7)
 app.add_middleware(SecurityHeadersMiddleware)
 
 # Audit logging middleware (Phase 7)
-if settings.enable_audit_logging:
-    app.add_middleware(AuditMiddleware)
+if _AUDIT:
+    app.add_middleware(AuditMiddleware, skip_paths=DEFAULT_SKIP_PATHS)
     logger.info("Audit logging middleware enabled")
 
 # CORS middleware
-if settings.is_development():
+if _IS_DEV:
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -137,7 +161,7 @@ if settings.is_development():
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
     """Handle rate limit exceeded errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=exc.to_dict(),
         headers={"Retry-After": str(exc.retry_after)}
@@ -147,7 +171,7 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
 @app.exception_handler(ValidationError)
 async def validation_error_handler(request: Request, exc: ValidationError):
     """Handle validation errors."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=exc.to_dict()
     )
@@ -156,7 +180,7 @@ async def validation_error_handler(request: Request, exc: ValidationError):
 @app.exception_handler(ChatbotException)
 async def chatbot_exception_handler(request: Request, exc: ChatbotException):
     """Handle all custom chatbot exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=exc.to_dict()
     )
@@ -172,13 +196,13 @@ async def global_exception_handler(request: Request, exc: Exception):
     """
     logger.exception(f"Unhandled exception: {exc}")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "internal_error",
             "message": "An unexpected error occurred",
-            "details": str(exc) if settings.is_development() else None,
-            "timestamp": datetime.utcnow().isoformat()
+            "details": str(exc) if _IS_DEV else None,
+            "timestamp": datetime.now(timezone.utc).isoformat()
         }
     )
 
@@ -216,5 +240,5 @@ if __name__ == "__main__":
         "src.api.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.is_development()
+        reload=_IS_DEV
     )
@@ -7,24 +7,31 @@ This module defines the /chat endpoint which supports:
 
 Phase 7 adds rate limiting, input validation, and enhanced error handling.
 """
+import asyncio
+import time
 import uuid
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 
+from src.core.concurrency import get_llm_limiter, is_rate_limit_error
 from src.core.logging_config import get_logger
 from src.core.rate_limiter import get_rate_limiter
-from src.core.validators import validate_message, validate_session_id, validate_mode
+from src.core.validators import validate_chat_input
 from src.core.exceptions import RateLimitExceeded, ValidationError
+from src.database import get_schema_cache, get_session_components
 from src.models.chat import ChatRequest, ChatResponse, ErrorResponse
 from src.services.chat_service import ChatService, ChatServiceError
-from src.services.sql_service import get_sql_service
+from src.services.sql_service import SQLService, get_sql_service
 
 logger = get_logger(__name__)
 
 router = APIRouter(
     prefix="/chat",
     tags=["Chat"],
+    default_response_class=ORJSONResponse,
     responses={
         429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
         500: {"model": ErrorResponse, "description": "Internal server error"}
@@ -43,6 +50,17 @@ def get_chat_service() -> ChatService:
     return _chat_service
 
 
+async def chat_service_dep() -> ChatService:
+    """
+    FastAPI dependency for the shared chat service.
+    
+    Declared async so it is resolved inline on the event loop rather than
+    through the threadpool used for sync dependencies. The instance is
+    created at startup (see lifespan), so this is just a lookup.
+    """
+    return get_chat_service()
+
+
 @router.post(
     "",
     response_model=ChatResponse,
@@ -72,7 +90,11 @@ def get_chat_service() -> ChatService:
     - Follow-up: "Show me movies from 1994"
     """
 )
-async def send_message(request: ChatRequest, response: Response) -> ChatResponse:
+async def send_message(
+    request: ChatRequest,
+    response: Response,
+    chat_service: ChatService = Depends(chat_service_dep)
+) -> ChatResponse:
     """
     Process a user message and return the assistant's response.
     
@@ -84,21 +106,12 @@ async def send_message(request: ChatRequest, response: Response) -> ChatResponse
     # Phase 7: Input Validation
     # ============================================================
     
-    # Validate session_id format if provided
-    if request.session_id:
-        is_valid, error = validate_session_id(request.session_id)
-        if not is_valid:
-            raise ValidationError(error, field="session_id")
-    
-    # Validate and sanitize message
-    is_valid, sanitized_message, error = validate_message(request.message)
-    if not is_valid:
-        raise ValidationError(error, field="message")
-    
-    # Validate mode
-    is_valid, error = validate_mode(request.mode)
-    if not is_valid:
-        raise ValidationError(error, field="mode")
+    # Validate session_id (if provided), sanitize message and check mode
+    sanitized_message, error, field = validate_chat_input(
+        request.message, request.session_id, request.mode
+    )
+    if error:
+        raise ValidationError(error, field=field)
     
     # ============================================================
     # Phase 7: Rate Limiting
@@ -112,27 +125,26 @@ async def send_message(request: ChatRequest, response: Response) -> ChatResponse
     response.headers["X-RateLimit-Remaining"] = str(remaining)
     
     if not is_allowed:
-        reset_time = rate_limiter.get_reset_time(session_id)
-        retry_after = max(1, int((reset_time - datetime.utcnow()).total_seconds()))
+        # Reset time is an epoch timestamp, so no datetime arithmetic needed
+        reset_ts = rate_limiter.get_reset_time(session_id)
+        retry_after = max(1, int(reset_ts - time.time()))
         raise RateLimitExceeded(retry_after=retry_after)
     
     # ============================================================
     # Process Request
     # ============================================================
     
+    # Lazy %-formatting: arguments (and the %.Ns truncation) are only
+    # formatted if INFO is enabled
     logger.info(
-        f"Processing request: mode={request.mode}, "
-        f"session={session_id[:8]}..., "
-        f"message={sanitized_message[:50]}..."
+        "Processing request: mode=%s, session=%.8s..., message=%.50s...",
+        request.mode, session_id, sanitized_message
     )
     
     try:
         if request.mode == "sql":
             # SQL mode - Text-to-SQL with session context
             # Get session-specific database components
-            from src.database import get_session_components
-            from src.services.sql_service import SQLService
-            
             db_conn, inspector, executor, loader = get_session_components(session_id)
             
             if inspector is None or executor is None:
@@ -141,18 +153,34 @@ async def send_message(request: ChatRequest, response: Response) -> ChatResponse
                     detail="No database connection found. Please connect to a database first via the frontend."
                 )
             
+            # Table names are cached per session (filled on connect, dropped
+            # whenever the session's tables change), so only reflect on a miss
+            schema_cache = get_schema_cache()
+            table_names = schema_cache.get_table_names(session_id)
+            if table_names is None:
+                table_names = await run_in_threadpool(inspector.get_table_names)
+                schema_cache.set_table_names(session_id, table_names)
+            
             # Initialize SQL service with session components
             sql_service = SQLService(
                 memory_manager=None,  # Will use global singleton
                 executor=executor,
-                schema_inspector=inspector
+                schema_inspector=inspector,
+                table_names=table_names
             )
             
-            result = sql_service.query(
-                question=sanitized_message,  # Use sanitized message
-                session_id=session_id,
-                include_analysis=request.include_analysis
-            )
+            # LLM + DB I/O is blocking; run it off the event loop so other
+            # requests can be served meanwhile. The adaptive limiter caps
+            # concurrent LLM calls and backs off when the provider returns 429s.
+            llm_limiter = get_llm_limiter()
+            async with llm_limiter:
+                result = await asyncio.to_thread(
+                    sql_service.query,
+                    question=sanitized_message,  # Use sanitized message
+                    session_id=session_id,
+                    include_analysis=request.include_analysis
+                )
+            await llm_limiter.record(overloaded=is_rate_limit_error(result.error))
             
             return ChatResponse(
                 message=result.answer,
@@ -173,16 +201,15 @@ async def send_message(request: ChatRequest, response: Response) -> ChatResponse
         
         else:
             # Chat mode - General conversation with memory
-            chat_service = get_chat_service()
-            
             # Ensure session_id is in request for memory tracking
-            request_with_session = ChatRequest(
-                message=sanitized_message,  # Use sanitized message
-                session_id=session_id,
-                mode=request.mode
+            # (model_copy reuses the already-validated request)
+            request_with_session = request.model_copy(
+                update={"message": sanitized_message, "session_id": session_id}
             )
             
-            result = chat_service.process_message(request_with_session)
+            result = await run_in_threadpool(
+                chat_service.process_message, request_with_session
+            )
             
             return ChatResponse(
                 message=result.message,
@@ -7,10 +7,11 @@ These endpoints allow users to:
 - Disconnect from databases
 - Check connection status
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from fastapi import APIRouter, HTTPException, Depends
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 
 from src.core.logging_config import get_logger
 from src.database import (
@@ -18,7 +19,7 @@ from src.database import (
     DatabaseCredentials,
     SessionConnectionManager,
     SchemaInspector,
-    DatabaseConnection
+    get_schema_cache,
 )
 
 logger = get_logger(__name__)
@@ -26,19 +27,39 @@ logger = get_logger(__name__)
 router = APIRouter(
     prefix="/connection",
     tags=["Connection"],
+    default_response_class=ORJSONResponse,
 )
 
 
 # Request/Response models
-class ConnectionTestRequest(BaseModel):
-    """Request to test a database connection."""
+class DatabaseCredentialsModel(BaseModel):
+    """Database credential fields shared by the connection request models."""
+    # Requests are never modified after parsing; frozen also makes them hashable
+    model_config = ConfigDict(frozen=True)
+    
     db_type: str = Field(..., description="Database type: mysql or postgresql")
     host: str = Field(..., description="Database host address")
-    port: int = Field(default=None, description="Database port (default: 3306 for MySQL, 5432 for PostgreSQL)")
+    port: Optional[int] = Field(default=None, description="Database port (default: 3306 for MySQL, 5432 for PostgreSQL)")
     database: str = Field(..., description="Database name")
     username: str = Field(..., description="Database username")
     password: str = Field(..., description="Database password")
     use_ssl: bool = Field(default=False, description="Use SSL/TLS connection")
+    
+    def to_credentials(self) -> DatabaseCredentials:
+        """Build the DatabaseCredentials used by the connection manager."""
+        return DatabaseCredentials(
+            db_type=self.db_type,
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            username=self.username,
+            password=self.password,
+            use_ssl=self.use_ssl
+        )
+
+
+class ConnectionTestRequest(DatabaseCredentialsModel):
+    """Request to test a database connection."""
 
 
 class ConnectionTestResponse(BaseModel):
@@ -47,16 +68,9 @@ class ConnectionTestResponse(BaseModel):
     message: str
 
 
-class ConnectionCreateRequest(BaseModel):
+class ConnectionCreateRequest(DatabaseCredentialsModel):
     """Request to create a session connection."""
     session_id: str = Field(..., description="Session identifier")
-    db_type: str = Field(..., description="Database type: mysql or postgresql")
-    host: str = Field(..., description="Database host address")
-    port: int = Field(default=None, description="Database port")
-    database: str = Field(..., description="Database name")
-    username: str = Field(..., description="Database username")
-    password: str = Field(..., description="Database password")
-    use_ssl: bool = Field(default=False, description="Use SSL/TLS connection")
 
 
 class ConnectionCreateResponse(BaseModel):
@@ -74,6 +88,8 @@ class ConnectionStatusResponse(BaseModel):
 
 class ConnectionDisconnectRequest(BaseModel):
     """Request to disconnect."""
+    model_config = ConfigDict(frozen=True)
+    
     session_id: str = Field(..., description="Session identifier")
 
 
@@ -99,9 +115,9 @@ class ConnectionDisconnectResponse(BaseModel):
     - SSL/TLS connections
     """
 )
-async def test_connection(request: ConnectionTestRequest) -> ConnectionTestResponse:
+def test_connection(request: ConnectionTestRequest) -> ConnectionTestResponse:
     """Test database connection without creating a session connection."""
-    logger.info(f"Testing connection to {request.db_type}://{request.host}/{request.database}")
+    logger.info("Testing connection to %s://%s/%s", request.db_type, request.host, request.database)
     
     # Validate database type
     if request.db_type.lower() not in ["mysql", "postgresql"]:
@@ -111,15 +127,7 @@ async def test_connection(request: ConnectionTestRequest) -> ConnectionTestRespo
         )
     
     # Create credentials
-    credentials = DatabaseCredentials(
-        db_type=request.db_type,
-        host=request.host,
-        port=request.port,
-        database=request.database,
-        username=request.username,
-        password=request.password,
-        use_ssl=request.use_ssl
-    )
+    credentials = request.to_credentials()
     
     # Test connection
     manager = get_connection_manager()
@@ -142,11 +150,11 @@ async def test_connection(request: ConnectionTestRequest) -> ConnectionTestRespo
     in this session until disconnected.
     """
 )
-async def create_connection(request: ConnectionCreateRequest) -> ConnectionCreateResponse:
+def create_connection(request: ConnectionCreateRequest) -> ConnectionCreateResponse:
     """Create a database connection for a session."""
     logger.info(
-        f"Creating connection for session {request.session_id}: "
-        f"{request.db_type}://{request.host}/{request.database}"
+        "Creating connection for session %s: %s://%s/%s",
+        request.session_id, request.db_type, request.host, request.database
     )
     
     # Validate database type
@@ -157,18 +165,12 @@ async def create_connection(request: ConnectionCreateRequest) -> ConnectionCreat
         )
     
     # Create credentials
-    credentials = DatabaseCredentials(
-        db_type=request.db_type,
-        host=request.host,
-        port=request.port,
-        database=request.database,
-        username=request.username,
-        password=request.password,
-        use_ssl=request.use_ssl
-    )
+    credentials = request.to_credentials()
     
-    # Create connection
+    # Create connection (any schema cached for a previous connection is stale)
     manager = get_connection_manager()
+    schema_cache = get_schema_cache()
+    schema_cache.invalidate(request.session_id)
     success, message = manager.create_connection(request.session_id, credentials)
     
     if not success:
@@ -185,9 +187,11 @@ async def create_connection(request: ConnectionCreateRequest) -> ConnectionCreat
     try:
         engine = manager.get_connection(request.session_id)
         if engine:
-            db_conn = DatabaseConnection(credentials.to_connection_url())
-            inspector = SchemaInspector(db_conn)
+            # Inspect through the session's pooled engine rather than
+            # opening a second engine (and TLS handshake) just to list tables
+            inspector = SchemaInspector(engine)
             table_names = inspector.get_table_names()
+            schema_cache.set_table_names(request.session_id, table_names)
             
             # Filter out system tables
             user_tables = [
@@ -214,12 +218,13 @@ async def create_connection(request: ConnectionCreateRequest) -> ConnectionCreat
     summary="Disconnect session database",
     description="Close the database connection for a session."
 )
-async def disconnect_connection(request: ConnectionDisconnectRequest) -> ConnectionDisconnectResponse:
+def disconnect_connection(request: ConnectionDisconnectRequest) -> ConnectionDisconnectResponse:
     """Disconnect a session's database connection."""
-    logger.info(f"Disconnecting session {request.session_id}")
+    logger.info("Disconnecting session %s", request.session_id)
     
     manager = get_connection_manager()
     success = manager.close_connection(request.session_id)
+    get_schema_cache().invalidate(request.session_id)
     
     if success:
         return ConnectionDisconnectResponse(
@@ -239,7 +244,7 @@ async def disconnect_connection(request: ConnectionDisconnectRequest) -> Connect
     summary="Get connection status",
     description="Check if a session has an active database connection."
 )
-async def get_connection_status(session_id: str) -> ConnectionStatusResponse:
+def get_connection_status(session_id: str) -> ConnectionStatusResponse:
     """Get the connection status for a session."""
     manager = get_connection_manager()
     conn_info = manager.get_connection_info(session_id)
@@ -261,7 +266,7 @@ async def get_connection_status(session_id: str) -> ConnectionStatusResponse:
     summary="Get connection manager statistics",
     description="Get statistics about active connections (for monitoring)."
 )
-async def get_connection_stats() -> Dict[str, Any]:
+def get_connection_stats() -> Dict[str, Any]:
     """Get connection manager statistics."""
     manager = get_connection_manager()
     
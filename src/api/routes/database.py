@@ -7,11 +7,18 @@ These endpoints allow:
 - Inspecting database schema
 - Testing queries (development only)
 """
+import hashlib
+import os
+import re
 import shutil
+import time
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import BinaryIO, Dict, List, Any, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, UploadFile, File
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, UploadFile, File
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 
@@ -22,6 +29,9 @@ from src.database import (
     SchemaInspector,
     QueryExecutor,
     get_database,
+    get_schema_cache,
+    get_session_components,
+    sanitize_name,
 )
 
 logger = get_logger(__name__)
@@ -29,11 +39,146 @@ logger = get_logger(__name__)
 router = APIRouter(
     prefix="/database",
     tags=["Database"],
+    default_response_class=ORJSONResponse,
 )
 
+# Settings are immutable, so evaluate these once rather than per request
+_IS_DEV = get_settings().is_development()
+
 # Data directory for CSV files
 DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
 
+# /health and /files are polled by load balancers and the UI; their
+# encoded bodies are reused for this long
+MICRO_CACHE_SECONDS = 5
+
+# (expires_at, body, etag) for /database/health
+_health_cache: Tuple[float, bytes, str] = (0.0, b"", "")
+
+# (data dir mtime_ns, expires_at, body, etag) for /database/files
+_files_cache: Tuple[int, float, bytes, str] = (0, 0.0, b"", "")
+
+# Internal tables hidden from /schema and never dropped via the API
+_PROTECTED_TABLES = frozenset({"conversation_sessions", "conversation_messages"})
+
+# Table names rejected by delete_table (statement separators / SQL comments)
+_UNSAFE_TABLE = re.compile(r";|--")
+MAX_TABLE_NAME_LENGTH = 200
+
+# Copy buffer for uploads (1 MiB: far fewer read/write syscalls than the 64 KiB default)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Chunks gathered per os.writev call when saving uploads
+UPLOAD_WRITEV_CHUNKS = 8
+
+
+# Bytes peeked from an upload to check that it is text before saving it
+UPLOAD_SNIFF_BYTES = 4096
+
+
+def _looks_like_csv(head: bytes) -> bool:
+    """
+    Cheap content check on the first bytes of an upload (non-empty, no NUL bytes).
+    
+    csv.Sniffer is deliberately not used: it raises on valid single-column
+    CSVs, which the loader accepts.
+    """
+    return bool(head.strip()) and b"\x00" not in head
+
+
+def _writev_all(fd: int, chunks: List[bytes]) -> None:
+    """Write every chunk with os.writev, resuming after partial writes."""
+    chunks = list(chunks)
+    while chunks:
+        written = os.writev(fd, chunks)
+        while chunks and written >= len(chunks[0]):
+            written -= len(chunks.pop(0))
+        if written:
+            chunks[0] = chunks[0][written:]
+
+
+def _save_upload(source: BinaryIO, file_path: Path) -> None:
+    """
+    Copy an uploaded file to disk in UPLOAD_CHUNK_SIZE chunks (blocking).
+    
+    Chunks are flushed UPLOAD_WRITEV_CHUNKS at a time with one writev call,
+    and the file is flagged for sequential access so the kernel can plan
+    writeback. Falls back to a buffered copy where writev is unavailable.
+    """
+    with open(file_path, "wb", buffering=0) as buffer:
+        fd = buffer.fileno()
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        if not hasattr(os, "writev"):
+            shutil.copyfileobj(source, buffer, UPLOAD_CHUNK_SIZE)
+            return
+        
+        chunks: List[bytes] = []
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            chunks.append(chunk)
+            if len(chunks) >= UPLOAD_WRITEV_CHUNKS:
+                _writev_all(fd, chunks)
+                chunks.clear()
+        if chunks:
+            _writev_all(fd, chunks)
+
+
+async def require_development() -> None:
+    """
+    Dependency that rejects the request outside development mode.
+    
+    Async so it runs inline on the event loop; the mode is captured at
+    import, so this is a single flag check before the handler is dispatched.
+    """
+    if not _IS_DEV:
+        raise HTTPException(
+            status_code=403,
+            detail="Raw query execution is only available in development mode"
+        )
+
+
+def _body_etag(body: bytes) -> str:
+    """Strong ETag for a serialized JSON response body."""
+    return '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (list, weak or '*' forms) against an ETag."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _conditional_response(body: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    """Build a JSON response with an ETag, answering 304 when the client copy is current."""
+    headers = {"ETag": etag}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _invalidate_files_cache() -> None:
+    """Forget the cached /files listing (overwriting a file keeps the dir mtime)."""
+    global _files_cache
+    _files_cache = (0, 0.0, b"", "")
+
+
+def _drop_table(db_conn, table_name: str) -> None:
+    """
+    Drop a table on the given connection (blocking).
+    
+    DDL runs on an AUTOCOMMIT connection, skipping the ORM session's
+    BEGIN/COMMIT round trips. Callers must have validated table_name
+    (unsafe patterns rejected, existence confirmed) before interpolating.
+    """
+    with db_conn.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text(f"DROP TABLE IF EXISTS `{table_name}`"))
+
 
 # Response models
 class TableSchema(BaseModel):
@@ -107,15 +252,25 @@ async def upload_csv(
             detail="Only CSV files are allowed"
         )
     
+    # Request bodies over MAX_UPLOAD_BYTES are rejected with 413 by
+    # BodySizeLimitMiddleware before the multipart body is parsed
+    
+    # Peek at the content so binary files are rejected before the copy
+    head = await file.read(UPLOAD_SNIFF_BYTES)
+    await file.seek(0)
+    if not _looks_like_csv(head):
+        raise HTTPException(
+            status_code=400,
+            detail="File does not look like a CSV (empty or binary content)"
+        )
+    
     # Sanitize filename
     safe_filename = file.filename.replace(" ", "_").lower()
     file_path = DATA_DIR / safe_filename
     
-    logger.info(f"Uploading CSV for session {session_id}: {safe_filename}")
+    logger.info("Uploading CSV for session %s: %s", session_id, safe_filename)
     
     try:
-        from src.database import get_session_components
-        
         # Get session-specific components
         db_conn, inspector, executor, loader = get_session_components(session_id)
         
@@ -128,26 +283,27 @@ async def upload_csv(
         # Ensure data directory exists
         DATA_DIR.mkdir(exist_ok=True)
         
-        # Save uploaded file
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Save uploaded file in a worker thread so the event loop stays free
+        await run_in_threadpool(_save_upload, file.file, file_path)
+        _invalidate_files_cache()
         
-        logger.info(f"Saved file to: {file_path}")
+        logger.info("Saved file to: %s", file_path)
         
         # Load into database using session connection
-        table_name = file_path.stem.lower().replace(" ", "_").replace("-", "_")
-        
-        # Check if table already exists
-        existing_tables = inspector.get_table_names()
+        table_name = sanitize_name(file_path.stem)
         
-        if table_name in existing_tables:
+        # Check if table already exists (blocking lookup, so keep it off the loop)
+        if await run_in_threadpool(inspector.table_exists, table_name):
             # Don't overwrite - return error
             raise HTTPException(
                 status_code=409,  # Conflict
                 detail=f"Table '{table_name}' already exists. Delete it first or use a different filename."
             )
         
-        rows_loaded = loader.load_file(file_path, table_name, drop_existing=False)
+        rows_loaded = await run_in_threadpool(
+            loader.load_file, file_path, table_name, drop_existing=False
+        )
+        get_schema_cache().invalidate(session_id)
         
         return UploadResponse(
             filename=safe_filename,
@@ -159,7 +315,7 @@ async def upload_csv(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Upload failed: {e}")
+        logger.error("Upload failed: %s", e)
         # Clean up file if loading failed
         if file_path.exists():
             file_path.unlink()
@@ -173,23 +329,50 @@ async def upload_csv(
     summary="List uploaded CSV files",
     description="Returns a list of CSV files in the data directory."
 )
-async def list_files() -> Dict[str, Any]:
-    """List all CSV files in the data directory."""
+def list_files(if_none_match: Optional[str] = Header(default=None)) -> Response:
+    """
+    List all CSV files in the data directory.
+    
+    The encoded listing is reused for MICRO_CACHE_SECONDS while the data
+    directory's mtime is unchanged (files added, removed or renamed bump it).
+    """
+    global _files_cache
     try:
-        files = []
-        for f in DATA_DIR.glob("*.csv"):
-            files.append({
-                "filename": f.name,
-                "size_bytes": f.stat().st_size,
-                "table_name": f.stem.lower().replace(" ", "_").replace("-", "_")
-            })
+        try:
+            dir_mtime = DATA_DIR.stat().st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime = 0
         
-        return {
+        now = time.monotonic()
+        cached_mtime, expires_at, body, etag = _files_cache
+        if body and cached_mtime == dir_mtime and now < expires_at:
+            return _conditional_response(body, etag, if_none_match)
+        
+        # scandir yields cached DirEntry metadata, saving a syscall per file
+        try:
+            with os.scandir(DATA_DIR) as entries:
+                files = [
+                    {
+                        "filename": entry.name,
+                        "size_bytes": entry.stat().st_size,
+                        "table_name": sanitize_name(entry.name[:-4])
+                    }
+                    for entry in entries
+                    if entry.name.endswith(".csv") and entry.is_file()
+                ]
+        except FileNotFoundError:
+            files = []
+        
+        body = orjson.dumps({
             "files": files,
             "count": len(files)
-        }
+        })
+        etag = _body_etag(body)
+        # Swap the whole tuple in one assignment so concurrent readers stay consistent
+        _files_cache = (dir_mtime, now + MICRO_CACHE_SECONDS, body, etag)
+        return _conditional_response(body, etag, if_none_match)
     except Exception as e:
-        logger.error(f"Failed to list files: {e}")
+        logger.error("Failed to list files: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -210,10 +393,11 @@ async def delete_file(filename: str) -> Dict[str, str]:
     
     try:
         file_path.unlink()
-        logger.info(f"Deleted file: {filename}")
+        _invalidate_files_cache()
+        logger.info("Deleted file: %s", filename)
         return {"message": f"Deleted {filename}"}
     except Exception as e:
-        logger.error(f"Failed to delete file: {e}")
+        logger.error("Failed to delete file: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -223,13 +407,21 @@ async def delete_file(filename: str) -> Dict[str, str]:
     summary="Get database schema",
     description="Returns information about all tables and columns in the session's connected database."
 )
-async def get_schema(session_id: str = None) -> SchemaResponse:
-    """Get the current database schema for a session."""
-    logger.info(f"Schema inspection requested for session: {session_id}")
+def get_schema(
+    session_id: str = None,
+    if_none_match: Optional[str] = Header(default=None)
+) -> Response:
+    """
+    Get the current database schema for a session.
+    
+    The encoded response body is cached per session (same TTL and
+    invalidation as the schema cache), so repeat hits skip both
+    inspection and serialization. Responses carry an ETag; a matching
+    If-None-Match gets an empty 304.
+    """
+    logger.info("Schema inspection requested for session: %s", session_id)
     
     try:
-        from src.database import get_session_components
-        
         # Get session-specific components
         db_conn, inspector, executor, loader = get_session_components(session_id)
         
@@ -239,17 +431,26 @@ async def get_schema(session_id: str = None) -> SchemaResponse:
                 detail="No database connection found. Please connect to a database first."
             )
         
-        tables = inspector.get_all_tables()
+        # Serve repeated schema requests from the per-session cache
+        schema_cache = get_schema_cache()
+        if session_id:
+            cached = schema_cache.get_response(session_id)
+            if cached is not None:
+                return _conditional_response(*cached, if_none_match)
+        
+        tables = schema_cache.get_tables(session_id) if session_id else None
+        if tables is None:
+            tables = inspector.get_all_tables()
+            if session_id:
+                schema_cache.set_tables(session_id, tables)
         
         # Filter out system tables
-        user_tables = [
-            t for t in tables 
-            if t.name not in ["conversation_sessions", "conversation_messages"]
-        ]
+        user_tables = [t for t in tables if t.name not in _PROTECTED_TABLES]
         
-        return SchemaResponse(
+        # Built from our own reflection results, so skip validation
+        schema_response = SchemaResponse.model_construct(
             tables=[
-                TableSchema(
+                TableSchema.model_construct(
                     name=t.name,
                     columns=[
                         {
@@ -266,10 +467,16 @@ async def get_schema(session_id: str = None) -> SchemaResponse:
             ],
             table_count=len(user_tables),
         )
+        
+        body = orjson.dumps(schema_response.model_dump())
+        etag = _body_etag(body)
+        if session_id:
+            schema_cache.set_response(session_id, body, etag)
+        return _conditional_response(body, etag, if_none_match)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Schema inspection failed: {e}")
+        logger.error("Schema inspection failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -280,12 +487,15 @@ async def get_schema(session_id: str = None) -> SchemaResponse:
     description="Loads all CSV files from the data/ directory into database tables."
 )
 async def load_csv_files() -> LoadResponse:
-    """Load all CSVs from the data directory."""
+    """Load all CSVs from the data directory (files are loaded in parallel)."""
     logger.info("CSV loading requested")
     
     try:
         loader = CSVLoader()
-        results = loader.load_all_csvs(drop_existing=True)
+        results = await loader.load_all_csvs_async(drop_existing=True)
+        
+        # Tables were recreated; sessions may point at the same database
+        get_schema_cache().invalidate()
         
         total_rows = sum(v for v in results.values() if v > 0)
         
@@ -295,7 +505,7 @@ async def load_csv_files() -> LoadResponse:
             message=f"Loaded {len(results)} tables with {total_rows} total rows",
         )
     except Exception as e:
-        logger.error(f"CSV loading failed: {e}")
+        logger.error("CSV loading failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -303,19 +513,12 @@ async def load_csv_files() -> LoadResponse:
     "/query",
     response_model=QueryResponse,
     summary="Execute a test query (dev only)",
-    description="Execute a raw SQL query. Only available in development mode."
+    description="Execute a raw SQL query. Only available in development mode.",
+    dependencies=[Depends(require_development)]
 )
-async def execute_query(request: QueryRequest) -> QueryResponse:
+def execute_query(request: QueryRequest) -> QueryResponse:
     """Execute a test query (development only)."""
-    settings = get_settings()
-    
-    if not settings.is_development():
-        raise HTTPException(
-            status_code=403,
-            detail="Raw query execution is only available in development mode"
-        )
-    
-    logger.info(f"Test query requested: {request.sql[:50]}...")
+    logger.info("Test query requested: %.50s...", request.sql)
     
     executor = QueryExecutor()
     result = executor.execute_with_limit(request.sql, limit=request.limit)
@@ -335,15 +538,29 @@ async def execute_query(request: QueryRequest) -> QueryResponse:
     summary="Database health check",
     description="Check if the database connection is healthy."
 )
-async def database_health() -> Dict[str, Any]:
-    """Check database connectivity."""
+def database_health(if_none_match: Optional[str] = Header(default=None)) -> Response:
+    """
+    Check database connectivity.
+    
+    The result is reused for MICRO_CACHE_SECONDS, so frequent polling
+    costs at most one SELECT 1 per interval.
+    """
+    global _health_cache
+    now = time.monotonic()
+    expires_at, body, etag = _health_cache
+    if now < expires_at:
+        return _conditional_response(body, etag, if_none_match)
+    
     db = get_database()
     is_healthy = db.check_connection()
     
-    return {
+    body = orjson.dumps({
         "healthy": is_healthy,
         "message": "Database connection OK" if is_healthy else "Database connection failed"
-    }
+    })
+    etag = _body_etag(body)
+    _health_cache = (now + MICRO_CACHE_SECONDS, body, etag)
+    return _conditional_response(body, etag, if_none_match)
 
 
 @router.delete(
@@ -359,23 +576,20 @@ async def delete_table(table_name: str, session_id: str) -> Dict[str, Any]:
     """
     # Basic validation to prevent SQL injection
     # Allow existing tables even with special chars, but block dangerous patterns
-    if not table_name or len(table_name) > 200 or '--' in table_name or ';' in table_name:
+    if not table_name or len(table_name) > MAX_TABLE_NAME_LENGTH or _UNSAFE_TABLE.search(table_name):
         raise HTTPException(
             status_code=400,
             detail="Invalid table name"
         )
     
     # Don't allow deleting system tables
-    protected_tables = {"conversation_sessions", "conversation_messages"}
-    if table_name.lower() in protected_tables:
+    if table_name.lower() in _PROTECTED_TABLES:
         raise HTTPException(
             status_code=403,
             detail=f"Cannot delete protected system table: {table_name}"
         )
     
     try:
-        from src.database import get_session_components
-        
         # Get session-specific components
         db_conn, inspector, executor, loader = get_session_components(session_id)
         
@@ -386,18 +600,17 @@ async def delete_table(table_name: str, session_id: str) -> Dict[str, Any]:
             )
         
         # Check if table exists
-        if table_name not in inspector.get_table_names():
+        if not await run_in_threadpool(inspector.table_exists, table_name):
             raise HTTPException(
                 status_code=404,
                 detail=f"Table not found: {table_name}"
             )
         
         # Drop the table
-        with db_conn.get_session() as session:
-            session.execute(text(f"DROP TABLE IF EXISTS `{table_name}`"))
-            session.commit()
+        await run_in_threadpool(_drop_table, db_conn, table_name)
+        get_schema_cache().invalidate(session_id)
         
-        logger.info(f"Deleted table: {table_name} for session {session_id}")
+        logger.info("Deleted table: %s for session %s", table_name, session_id)
         
         return {
             "message": f"Successfully deleted table '{table_name}'",
@@ -407,5 +620,5 @@ async def delete_table(table_name: str, session_id: str) -> Dict[str, Any]:
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete table: {e}")
+        logger.error("Failed to delete table: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
@@ -7,11 +7,12 @@ These endpoints are used for:
 3. Monitoring systems
 4. Quick system status verification
 """
-from datetime import datetime
+import time
+from datetime import datetime, timezone
+from typing import Tuple
 
 from fastapi import APIRouter
 
-from src.core.config import get_settings
 from src.core.logging_config import get_logger
 from src.models.chat import HealthResponse
 
@@ -25,6 +26,26 @@ router = APIRouter(
 # Application version - would typically come from package metadata
 APP_VERSION = "0.1.0"
 
+# (epoch second, naive UTC datetime) for the last probe timestamp handed out
+_timestamp_cache: Tuple[int, datetime] = (0, datetime.min)
+
+
+def _utc_now_seconds() -> datetime:
+    """
+    Current UTC time (naive, like datetime.utcnow) at one-second granularity.
+    
+    Probes hit these endpoints several times a second; reusing the datetime
+    for the current second avoids building a new one on every request.
+    """
+    global _timestamp_cache
+    now = time.time_ns() // 1_000_000_000
+    cached_second, cached_dt = _timestamp_cache
+    if now != cached_second:
+        cached_dt = datetime.fromtimestamp(now, tz=timezone.utc).replace(tzinfo=None)
+        # Swap the tuple in one assignment so concurrent readers never see a mix
+        _timestamp_cache = (now, cached_dt)
+    return cached_dt
+
 
 @router.get(
     "",
@@ -54,7 +75,7 @@ async def health_check() -> HealthResponse:
     return HealthResponse(
         status="healthy",
         version=APP_VERSION,
-        timestamp=datetime.utcnow()
+        timestamp=_utc_now_seconds()
     )
 
 
@@ -82,10 +103,8 @@ async def readiness_check() -> HealthResponse:
     """
     logger.debug("Readiness check requested")
     
-    settings = get_settings()
-    
     return HealthResponse(
         status="ready",
         version=APP_VERSION,
-        timestamp=datetime.utcnow()
+        timestamp=_utc_now_seconds()
     )
@@ -8,19 +8,55 @@ Endpoints:
 - GET /session/{id}/history: Get conversation history
 - GET /session/list: List all sessions (Phase 6 - LTM)
 """
+import os
+import threading
 import uuid
-from typing import Optional, List
+from collections import deque
+from typing import Deque, Optional, List
 from datetime import datetime
 
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
+from sqlalchemy import text
 
 from src.core.logging_config import get_logger
 from src.core.config import get_settings
 from src.memory import get_memory_manager
 
 logger = get_logger(__name__)
-router = APIRouter(prefix="/session", tags=["Session Management"])
+router = APIRouter(
+    prefix="/session",
+    tags=["Session Management"],
+    default_response_class=ORJSONResponse,
+)
+
+# Settings are immutable, so evaluate these once rather than per request
+_MEMORY_PERSISTENT = get_settings().memory_persistent
+_STORAGE = "persistent" if _MEMORY_PERSISTENT else "memory"
+
+# Session IDs generated per refill (one os.urandom call for the whole batch)
+SESSION_ID_BATCH_SIZE = 256
+
+_session_id_pool: Deque[str] = deque()
+_session_id_lock = threading.Lock()
+
+
+def _new_session_id() -> str:
+    """
+    Return a fresh random (version 4) UUID string for a new session.
+    
+    IDs are generated in batches from a single os.urandom read and handed
+    out one at a time, instead of one urandom syscall per session.
+    """
+    with _session_id_lock:
+        if not _session_id_pool:
+            raw = os.urandom(16 * SESSION_ID_BATCH_SIZE)
+            _session_id_pool.extend(
+                str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+                for i in range(0, len(raw), 16)
+            )
+        return _session_id_pool.popleft()
 
 
 # ============================================================
@@ -103,20 +139,17 @@ async def create_session():
     Returns a unique session ID that can be used in /chat requests
     to maintain conversation context.
     """
-    session_id = str(uuid.uuid4())
-    settings = get_settings()
-    
+    session_id = _new_session_id()
     # Pre-create the session in memory manager
     manager = get_memory_manager()
     manager.get_or_create_session(session_id)
     
-    storage = "persistent" if settings.memory_persistent else "memory"
-    logger.info(f"Created new session via API: {session_id} (storage={storage})")
+    logger.info(f"Created new session via API: {session_id} (storage={_STORAGE})")
     
     return SessionCreateResponse(
         session_id=session_id,
         message="Session created successfully. Use this session_id in your /chat requests.",
-        storage=storage
+        storage=_STORAGE
     )
 
 
@@ -134,10 +167,9 @@ async def list_sessions(
     
     Only available when MEMORY_PERSISTENT=true.
     """
-    settings = get_settings()
     manager = get_memory_manager()
     
-    if not settings.memory_persistent:
+    if not _MEMORY_PERSISTENT:
         # For in-memory, we can still return cached sessions
         stats = manager.get_stats()
         return SessionListResponse(
@@ -197,9 +229,7 @@ async def delete_all_sessions():
     
     This permanently removes all conversation history.
     """
-    settings = get_settings()
-    
-    if not settings.memory_persistent:
+    if not _MEMORY_PERSISTENT:
         # For in-memory, just reset the manager
         from src.memory import reset_memory_manager
         reset_memory_manager()
@@ -216,15 +246,35 @@ async def delete_all_sessions():
         
         db = get_database()
         
+        messages_table = ConversationMessage.__tablename__
+        sessions_table = ConversationSession.__tablename__
+        dialect = db.engine.dialect.name
+        
         with db.get_session() as session:
             # Count before deletion
             session_count = session.query(ConversationSession).count()
             message_count = session.query(ConversationMessage).count()
             
-            # Delete all messages first (foreign key)
-            session.query(ConversationMessage).delete()
-            # Delete all sessions
-            session.query(ConversationSession).delete()
+            # TRUNCATE drops the data in one metadata operation instead of
+            # deleting (and logging) every row
+            if dialect == "postgresql":
+                session.execute(text(
+                    f"TRUNCATE TABLE {messages_table}, {sessions_table} "
+                    "RESTART IDENTITY CASCADE"
+                ))
+            elif dialect == "mysql":
+                # MySQL refuses to truncate a table referenced by a foreign key
+                session.execute(text("SET FOREIGN_KEY_CHECKS=0"))
+                try:
+                    session.execute(text(f"TRUNCATE TABLE `{messages_table}`"))
+                    session.execute(text(f"TRUNCATE TABLE `{sessions_table}`"))
+                finally:
+                    session.execute(text("SET FOREIGN_KEY_CHECKS=1"))
+            else:
+                # Delete all messages first (foreign key)
+                session.query(ConversationMessage).delete()
+                # Delete all sessions
+                session.query(ConversationSession).delete()
             session.commit()
         
         # Reset in-memory cache too
@@ -348,11 +398,10 @@ async def get_manager_stats():
     
     Returns counts of active sessions, total messages, and configuration.
     """
-    settings = get_settings()
     manager = get_memory_manager()
     stats = manager.get_stats()
     
     # Ensure required fields
-    stats.setdefault("storage", "persistent" if settings.memory_persistent else "memory")
+    stats.setdefault("storage", _STORAGE)
     
     return ManagerStatsResponse(**stats)
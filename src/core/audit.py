@@ -10,9 +10,10 @@ This middleware logs all API requests including:
 Logs are written to the application log file.
 """
 import time
-from typing import Callable
+from typing import Callable, Iterable
 
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 from starlette.requests import Request
 from starlette.responses import Response
 
@@ -20,15 +21,69 @@ from src.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Probe and documentation paths that are passed through without audit logging
+DEFAULT_SKIP_PATHS = frozenset({
+    "/", "/health", "/health/ready", "/docs", "/openapi.json", "/redoc"
+})
 
-class AuditMiddleware(BaseHTTPMiddleware):
+# Liveness/readiness probe paths
+HEALTH_PATHS = frozenset({"/health", "/health/ready"})
+
+# Security headers pre-encoded as raw ASGI (name, value) pairs
+SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+)
+_SECURITY_HEADER_NAMES = frozenset(name for name, _ in SECURITY_HEADERS)
+
+
+class SkipPathsMiddleware(BaseHTTPMiddleware):
+    """
+    BaseHTTPMiddleware that forwards selected paths untouched.
+    
+    The path check runs on the raw ASGI scope, so skipped requests never
+    build a Request object or go through the call_next stream machinery.
+    """
+    
+    def __init__(self, app: ASGIApp, skip_paths: Iterable[str] = ()):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The wrapped ASGI application
+            skip_paths: Paths passed straight to the wrapped app
+        """
+        super().__init__(app)
+        self.skip_paths = frozenset(skip_paths)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+class AuditMiddleware(SkipPathsMiddleware):
     """
     Middleware for logging all requests and responses.
     
     Captures timing information and key request metadata
-    for debugging and compliance purposes.
+    for debugging and compliance purposes. Health probes and docs
+    (DEFAULT_SKIP_PATHS) are high-frequency and not audited.
     """
     
+    def __init__(self, app: ASGIApp, skip_paths: Iterable[str] = DEFAULT_SKIP_PATHS):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The wrapped ASGI application
+            skip_paths: Paths forwarded without audit logging (health probes, docs)
+        """
+        super().__init__(app, skip_paths)
+    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and log audit information."""
         start_time = time.time()
@@ -58,8 +113,10 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 session_id=session_id
             )
             
-            # Add timing header
-            response.headers["X-Response-Time"] = f"{duration:.3f}s"
+            # Add timing header (appended raw; the header list is never scanned)
+            response.raw_headers.append(
+                (b"x-response-time", f"{duration:.3f}s".encode("latin-1"))
+            )
             
             return response
             
@@ -67,8 +124,8 @@ class AuditMiddleware(BaseHTTPMiddleware):
             # Log failed requests too
             duration = time.time() - start_time
             logger.error(
-                f"REQUEST FAILED: {method} {path} "
-                f"client={client_ip} duration={duration:.3f}s error={str(e)}"
+                "REQUEST FAILED: %s %s client=%s duration=%.3fs error=%s",
+                method, path, client_ip, duration, e
             )
             raise
     
@@ -82,13 +139,6 @@ class AuditMiddleware(BaseHTTPMiddleware):
         session_id: str
     ) -> None:
         """Log request details."""
-        # Skip health checks from verbose logging
-        if path in ("/health", "/health/ready"):
-            logger.debug(
-                f"HEALTH: {path} status={status_code} duration={duration:.3f}s"
-            )
-            return
-        
         # Determine log level based on status code
         if status_code >= 500:
             log_fn = logger.error
@@ -98,13 +148,12 @@ class AuditMiddleware(BaseHTTPMiddleware):
             log_fn = logger.info
         
         log_fn(
-            f"REQUEST: {method} {path} "
-            f"status={status_code} duration={duration:.3f}s "
-            f"client={client_ip} session={session_id}"
+            "REQUEST: %s %s status=%d duration=%.3fs client=%s session=%s",
+            method, path, status_code, duration, client_ip, session_id
         )
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware(SkipPathsMiddleware):
     """
     Middleware to add security headers to all responses.
     
@@ -113,16 +162,30 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - X-Frame-Options: DENY
     - X-XSS-Protection: 1; mode=block
     - Referrer-Policy: strict-origin-when-cross-origin
+    
+    Health probe responses (JSON read by orchestrators, not browsers)
+    are passed through without them.
     """
     
+    def __init__(self, app: ASGIApp, skip_paths: Iterable[str] = HEALTH_PATHS):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The wrapped ASGI application
+            skip_paths: Paths forwarded without security headers
+        """
+        super().__init__(app, skip_paths)
+    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Add security headers to response."""
         response = await call_next(request)
         
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        # Replace any of these headers a route already set (as header
+        # assignment would), in one pass over the header list instead of
+        # one MutableHeaders scan per header
+        raw_headers = response.raw_headers
+        raw_headers[:] = [h for h in raw_headers if h[0] not in _SECURITY_HEADER_NAMES]
+        raw_headers.extend(SECURITY_HEADERS)
         
         return response
@@ -0,0 +1,112 @@
+"""
+Body Size Limit Middleware - Reject oversized request bodies early.
+
+FastAPI parses (and spools to disk) a multipart upload before the route
+runs, so a size check inside the route comes too late. This middleware
+sits in front of the app on the raw ASGI interface:
+- A declared Content-Length over the limit gets a 413 before any body is read
+- Bodies without one (chunked) are counted as they arrive and cut off
+  with a 413 as soon as they pass the limit
+"""
+from typing import Iterable
+
+import orjson
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Routes that accept file uploads
+UPLOAD_PATHS = frozenset({"/database/upload"})
+
+
+class _BodyTooLarge(Exception):
+    """Raised from receive() to stop the app reading an oversized body."""
+
+
+class BodySizeLimitMiddleware:
+    """
+    Pure ASGI middleware enforcing a maximum request body size on selected paths.
+    
+    Example:
+        >>> app.add_middleware(BodySizeLimitMiddleware, max_bytes=100 * 1024 * 1024)
+    """
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_bytes: int,
+        paths: Iterable[str] = UPLOAD_PATHS
+    ):
+        """
+        Initialize the middleware.
+        
+        Args:
+            app: The wrapped ASGI application
+            max_bytes: Largest accepted request body (bytes)
+            paths: Paths the limit applies to
+        """
+        self.app = app
+        self.max_bytes = max_bytes
+        self.paths = frozenset(paths)
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+        
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_bytes:
+                    await self._reject(scope, send)
+                    return
+                break
+        
+        received = 0
+        exceeded = False
+        response_started = False
+        
+        async def limited_receive() -> Message:
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    exceeded = True
+                    raise _BodyTooLarge()
+            return message
+        
+        async def guarded_send(message: Message) -> None:
+            nonlocal response_started
+            if exceeded:
+                # Whatever the app made of the aborted body (e.g. a 400
+                # parse error) is replaced by the 413 sent below
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not exceeded or response_started:
+                raise
+        
+        if exceeded and not response_started:
+            await self._reject(scope, send)
+    
+    async def _reject(self, scope: Scope, send: Send) -> None:
+        """Send a 413 in the same {"detail": ...} shape as HTTPException."""
+        logger.warning("Rejected oversized body for %s (limit %d bytes)", scope["path"], self.max_bytes)
+        body = orjson.dumps({"detail": f"Request body too large (limit is {self.max_bytes} bytes)"})
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
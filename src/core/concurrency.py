@@ -0,0 +1,112 @@
+"""
+Concurrency Limiter - Adaptive cap on in-flight LLM requests.
+
+SQL mode calls the LLM provider for every question. Now that requests
+run concurrently, a burst could fire dozens of LLM calls at once and
+trigger cascading 429s upstream. This module caps in-flight calls with
+an AIMD (additive increase, multiplicative decrease) limit:
+- Each successful call raises the limit by 1, up to the configured ceiling
+- Each rate-limited call halves the limit (never below 1)
+"""
+import asyncio
+import weakref
+from typing import Optional
+
+from src.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Substrings that mark an upstream rate-limit/quota error (same heuristic
+# as the LLM client's fallback cascade)
+_RATE_LIMIT_MARKERS = ("429", "quota", "rate limit")
+
+
+def is_rate_limit_error(error: Optional[str]) -> bool:
+    """Check if an error message looks like an upstream rate limit."""
+    if not error:
+        return False
+    error = error.lower()
+    return any(marker in error for marker in _RATE_LIMIT_MARKERS)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Async limiter whose concurrency limit adapts to upstream feedback.
+    
+    Use as an async context manager around the call, then report how it went:
+    
+    Example:
+        >>> limiter = AdaptiveConcurrencyLimiter(max_limit=8)
+        >>> async with limiter:
+        ...     result = await asyncio.to_thread(call_llm)
+        >>> await limiter.record(overloaded=is_rate_limit_error(result.error))
+    """
+    
+    def __init__(self, max_limit: int = 8, min_limit: int = 1):
+        """
+        Initialize the limiter.
+        
+        Args:
+            max_limit: Ceiling (and starting value) for concurrent calls
+            min_limit: Floor the limit never drops below
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = self.max_limit
+        self.in_flight = 0
+        self._cond = asyncio.Condition()
+        
+        logger.info(f"AdaptiveConcurrencyLimiter initialized: max {self.max_limit} concurrent")
+    
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify()
+    
+    async def record(self, overloaded: bool) -> None:
+        """
+        Feed back the outcome of a call (AIMD adjustment).
+        
+        Args:
+            overloaded: True if the upstream rejected the call (e.g. 429)
+        """
+        async with self._cond:
+            if overloaded:
+                new_limit = max(self.min_limit, self.limit // 2)
+                if new_limit != self.limit:
+                    logger.warning(f"LLM concurrency limit reduced: {self.limit} -> {new_limit}")
+                self.limit = new_limit
+            elif self.limit < self.max_limit:
+                self.limit += 1
+                # A waiter may now fit under the raised limit
+                self._cond.notify()
+
+
+# LLM limiters for the SQL path, one per event loop: the limiter's
+# asyncio.Condition binds to the loop that first waits on it, so a single
+# module-global instance breaks under a second loop (TestClient, reloads).
+# Entries go away with their loop.
+_llm_limiters: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_llm_limiter() -> AdaptiveConcurrencyLimiter:
+    """
+    Get or create the LLM concurrency limiter for the running event loop.
+    
+    Must be called from a coroutine (it looks up the running loop).
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _llm_limiters.get(loop)
+    if limiter is None:
+        from src.core.config import get_settings
+        settings = get_settings()
+        limiter = _llm_limiters[loop] = AdaptiveConcurrencyLimiter(
+            max_limit=getattr(settings, 'llm_concurrency', 8)
+        )
+    return limiter
@@ -11,10 +11,10 @@ Why environment variables:
 4. Easy CI/CD override - No code changes needed per environment
 """
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
 
 from dotenv import load_dotenv
 
@@ -25,6 +25,27 @@ env_path = Path(__file__).parent.parent.parent / ".env"
 load_dotenv(env_path)
 
 
+def _strip_query_param(url: str, name: str) -> str:
+    """
+    Remove a query parameter from a URL using plain string operations.
+    
+    Other parameters are kept exactly as written (no re-encoding).
+    
+    Args:
+        url: URL possibly containing a query string
+        name: Parameter name to drop
+        
+    Returns:
+        URL without the parameter (and without a dangling '?')
+    """
+    base, sep, query = url.partition("?")
+    if not sep:
+        return url
+    prefix = name + "="
+    kept = [p for p in query.split("&") if p and not p.startswith(prefix) and p != name]
+    return f"{base}?{'&'.join(kept)}" if kept else base
+
+
 @dataclass(frozen=True)
 class Settings:
     """
@@ -43,6 +64,8 @@ class Settings:
         llm_model: Model identifier for LLaMA
         llm_temperature: LLM creativity (0.0 = deterministic, 1.0 = creative)
         llm_max_tokens: Maximum response length
+        llm_concurrency: Maximum concurrent LLM calls on the SQL path
+        max_upload_bytes: Largest accepted CSV upload (bytes)
     """
     # Application settings
     app_name: str
@@ -61,6 +84,7 @@ class Settings:
     llm_model_analysis: str
     llm_temperature: float
     llm_max_tokens: int
+    llm_concurrency: int
     
     # Memory settings (Phase 6)
     memory_persistent: bool
@@ -69,23 +93,39 @@ class Settings:
     rate_limit_per_minute: int
     query_timeout_seconds: int
     enable_audit_logging: bool
+    max_upload_bytes: int
+    
+    # Derived from app_env once in __post_init__
+    _is_dev: bool = field(init=False, repr=False, compare=False)
+    _is_prod: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        env = self.app_env.lower()
+        # frozen=True blocks normal assignment, even during construction
+        object.__setattr__(self, "_is_dev", env == "development")
+        object.__setattr__(self, "_is_prod", env == "production")
     
     def is_development(self) -> bool:
         """Check if running in development environment."""
-        return self.app_env.lower() == "development"
+        return self._is_dev
     
     def is_production(self) -> bool:
         """Check if running in production environment."""
-        return self.app_env.lower() == "production"
+        return self._is_prod
 
 
-def _get_env(key: str, default: Optional[str] = None) -> str:
+def _get_env(
+    key: str,
+    default: Optional[str] = None,
+    env: Optional[Mapping[str, str]] = None
+) -> str:
     """
     Get environment variable with optional default.
     
     Args:
         key: Environment variable name
         default: Default value if not set
+        env: Environment snapshot to read from (defaults to os.environ)
         
     Returns:
         Environment variable value
@@ -93,7 +133,7 @@ def _get_env(key: str, default: Optional[str] = None) -> str:
     Raises:
         ValueError: If required variable is not set and no default provided
     """
-    value = os.environ.get(key, default)
+    value = (os.environ if env is None else env).get(key, default)
     if value is None:
         raise ValueError(
             f"Required environment variable '{key}' is not set. "
@@ -119,20 +159,26 @@ def get_settings() -> Settings:
     Raises:
         ValueError: If required environment variables are missing
     """
+    # Read the environment once; every setting below comes from this snapshot
+    env = dict(os.environ)
+    
+    def get_env(key: str, default: Optional[str] = None) -> str:
+        return _get_env(key, default, env)
+    
     # Get database URL and fix dialect if needed
     # Priority:
     # 1. DATABASE_URL (Cloud/Aiven)
     # 2. Local Components (DB_HOST, DB_USER, etc)
-    database_url = os.environ.get("DATABASE_URL")
+    database_url = env.get("DATABASE_URL")
     
     if not database_url:
         # Fallback to constructing from components (Local MySQL)
         try:
-            host = _get_env("DB_HOST", "localhost")
-            port = _get_env("DB_PORT", "3306")
-            user = _get_env("DB_USER", "root")
-            password = _get_env("DB_PASSWORD", "")
-            name = _get_env("DB_NAME", "footwear_db")
+            host = get_env("DB_HOST", "localhost")
+            port = get_env("DB_PORT", "3306")
+            user = get_env("DB_USER", "root")
+            password = get_env("DB_PASSWORD", "")
+            name = get_env("DB_NAME", "footwear_db")
             
             # Construct MySQL URL
             database_url = f"mysql+pymysql://{user}:{password}@{host}:{port}/{name}"
@@ -150,40 +196,35 @@ def get_settings() -> Settings:
     # Aiven URLs often include this, but it crashes the python driver.
     # We strip it to allow connection (pymysql handles SSL negotiation automatically or via different means)
     if "ssl-mode=" in database_url:
-        import re
         # Remove ssl-mode param (either at start of query string or middle)
-        database_url = re.sub(r"[?&]ssl-mode=[^&]+", "", database_url)
-        
-        # Ensure if we removed the first param but left others, we clean up the syntax
-        # e.g. /db&other=1 -> /db?other=1 is not handled here but usually ssl-mode is the ONLY param
-        # Simplest fix for common Aiven URLs which end with it:
-        if "?" not in database_url and "&" in database_url:
-           database_url = database_url.replace("&", "?", 1) # simple patch if needed but re.sub usually safe enough for trailing
+        database_url = _strip_query_param(database_url, "ssl-mode")
     
     return Settings(
         # Application
-        app_name=_get_env("APP_NAME", "DataAnalyticsAssistant"),
-        app_env=_get_env("APP_ENV", "development"),
-        log_level=_get_env("LOG_LEVEL", "DEBUG"),
+        app_name=get_env("APP_NAME", "DataAnalyticsAssistant"),
+        app_env=get_env("APP_ENV", "development"),
+        log_level=get_env("LOG_LEVEL", "DEBUG"),
         
         # Database
         database_url=database_url,
         
         # LLM
-        groq_api_key=_get_env("GROQ_API_KEY"),
-        google_api_key=_get_env("GOOGLE_API_KEY"),
-        llm_model=_get_env("LLM_MODEL", "llama-3.3-70b-versatile"),
-        llm_model_fast=_get_env("LLM_MODEL_FAST", "llama-3.1-8b-instant"),
-        llm_model_smart=_get_env("LLM_MODEL_SMART", "llama-3.3-70b-versatile"),
-        llm_model_analysis=_get_env("LLM_MODEL_ANALYSIS", "models/gemini-flash-latest"),
-        llm_temperature=float(_get_env("LLM_TEMPERATURE", "0.1")),
-        llm_max_tokens=int(_get_env("LLM_MAX_TOKENS", "2048")),
+        groq_api_key=get_env("GROQ_API_KEY"),
+        google_api_key=get_env("GOOGLE_API_KEY"),
+        llm_model=get_env("LLM_MODEL", "llama-3.3-70b-versatile"),
+        llm_model_fast=get_env("LLM_MODEL_FAST", "llama-3.1-8b-instant"),
+        llm_model_smart=get_env("LLM_MODEL_SMART", "llama-3.3-70b-versatile"),
+        llm_model_analysis=get_env("LLM_MODEL_ANALYSIS", "models/gemini-flash-latest"),
+        llm_temperature=float(get_env("LLM_TEMPERATURE", "0.1")),
+        llm_max_tokens=int(get_env("LLM_MAX_TOKENS", "2048")),
+        llm_concurrency=int(get_env("LLM_CONCURRENCY", "8")),
         
         # Memory (Phase 6)
-        memory_persistent=_get_env("MEMORY_PERSISTENT", "false").lower() == "true",
+        memory_persistent=get_env("MEMORY_PERSISTENT", "false").lower() == "true",
         
         # Safety (Phase 7)
-        rate_limit_per_minute=int(_get_env("RATE_LIMIT_PER_MINUTE", "30")),
-        query_timeout_seconds=int(_get_env("QUERY_TIMEOUT_SECONDS", "30")),
-        enable_audit_logging=_get_env("ENABLE_AUDIT_LOGGING", "true").lower() == "true",
+        rate_limit_per_minute=int(get_env("RATE_LIMIT_PER_MINUTE", "30")),
+        query_timeout_seconds=int(get_env("QUERY_TIMEOUT_SECONDS", "30")),
+        enable_audit_logging=get_env("ENABLE_AUDIT_LOGGING", "true").lower() == "true",
+        max_upload_bytes=int(get_env("MAX_UPLOAD_BYTES", str(100 * 1024 * 1024))),
     )
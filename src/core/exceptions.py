@@ -18,13 +18,38 @@ class ChatbotException(Exception):
     status_code: int = 500
     error_code: str = "internal_error"
     
+    # Subclasses with a parameterless form set this; their default error
+    # body is built once per class instead of on every response
+    default_message: Optional[str] = None
+    _default_dict: Optional[dict] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.default_message is not None:
+            cls._default_dict = {
+                "error": cls.error_code,
+                "message": cls.default_message,
+                "details": None
+            }
+    
     def __init__(self, message: str, details: Optional[str] = None):
         super().__init__(message)
         self.message = message
         self.details = details
     
     def to_dict(self) -> dict:
-        """Convert to error response dict."""
+        """
+        Convert to error response dict.
+        
+        Exceptions raised with their class's default message share one
+        prebuilt dict, so treat the result as read-only.
+        """
+        if (
+            self._default_dict is not None
+            and self.message is self.default_message
+            and self.details is None
+        ):
+            return self._default_dict
         return {
             "error": self.error_code,
             "message": self.message,
@@ -59,8 +84,9 @@ class DatabaseError(ChatbotException):
     """Raised when database operations fail."""
     status_code = 503
     error_code = "database_error"
+    default_message = "Database operation failed"
     
-    def __init__(self, message: str = "Database operation failed"):
+    def __init__(self, message: str = default_message):
         super().__init__(message)
 
 
@@ -68,8 +94,9 @@ class LLMError(ChatbotException):
     """Raised when LLM API calls fail."""
     status_code = 503
     error_code = "llm_error"
+    default_message = "LLM service unavailable"
     
-    def __init__(self, message: str = "LLM service unavailable"):
+    def __init__(self, message: str = default_message):
         super().__init__(message)
 
 
@@ -102,8 +129,9 @@ class SQLGenerationError(ChatbotException):
     """Raised when SQL generation fails."""
     status_code = 400
     error_code = "sql_generation_error"
+    default_message = "Could not generate SQL for this question"
     
-    def __init__(self, message: str = "Could not generate SQL for this question"):
+    def __init__(self, message: str = default_message):
         super().__init__(message)
 
 
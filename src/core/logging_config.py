@@ -10,9 +10,11 @@ Why centralized logging:
 3. Easy to extend - Add handlers (file, remote, etc.) centrally
 4. Correlation IDs - Enable request tracing across modules
 """
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -20,6 +22,12 @@ from typing import Optional
 # Module-level flag to prevent duplicate handler registration
 _logging_configured = False
 
+# Days of rotated log files kept alongside the current app.log
+LOG_BACKUP_DAYS = 14
+
+# Background thread that writes queued records to the console/file handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(log_level: str = "DEBUG", log_dir: Optional[Path] = None) -> logging.Logger:
     """
@@ -28,9 +36,14 @@ def setup_logging(log_level: str = "DEBUG", log_dir: Optional[Path] = None) -> l
     This function should be called once at application startup.
     It configures both console and file logging with consistent formatting.
     
+    Loggers only enqueue records (QueueHandler); a QueueListener thread
+    does the formatting and console/file I/O, so request handlers never
+    block on a write.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: Directory for log files. Defaults to 'logs/' in project root.
+            The current file is app.log; daily backups are app.log.YYYY-MM-DD.
         
     Returns:
         Configured root logger instance
@@ -40,7 +53,7 @@ def setup_logging(log_level: str = "DEBUG", log_dir: Optional[Path] = None) -> l
         >>> logger = setup_logging("INFO")
         >>> logger.info("Application started")
     """
-    global _logging_configured
+    global _logging_configured, _queue_listener
     
     # Prevent duplicate handler registration on repeated calls
     if _logging_configured:
@@ -63,17 +76,34 @@ def setup_logging(log_level: str = "DEBUG", log_dir: Optional[Path] = None) -> l
     console_handler.setFormatter(formatter)
     console_handler.setLevel(getattr(logging, log_level.upper()))
     
-    # File handler - daily log files for persistence
-    log_file = log_dir / f"app_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    # File handler - logs/app.log, rotated at midnight into app.log.YYYY-MM-DD
+    # backups (this replaces the old one-file-per-start app_YYYYMMDD.log).
+    # delay=True defers opening the file until the first record is written.
+    # Rotation is per process: run one process per log_dir, since several
+    # workers sharing app.log would each try to rename it at midnight.
+    log_file = log_dir / "app.log"
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        log_file,
+        when="midnight",
+        backupCount=LOG_BACKUP_DAYS,
+        encoding="utf-8",
+        delay=True,
+    )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.DEBUG)  # File captures everything
     
+    # Hand records to a background thread; handler levels still apply there
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(shutdown_logging)
+    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Allow all levels through
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     # Suppress noisy third-party loggers
     # These libraries log excessively at DEBUG level
@@ -84,11 +114,23 @@ def setup_logging(log_level: str = "DEBUG", log_dir: Optional[Path] = None) -> l
     _logging_configured = True
     
     # Log that logging is configured (useful for debugging)
-    root_logger.debug(f"Logging configured: level={log_level}, file={log_file}")
+    root_logger.debug("Logging configured: level=%s, file=%s", log_level, log_file)
     
     return root_logger
 
 
+def shutdown_logging() -> None:
+    """
+    Stop the background log listener, flushing any queued records.
+    
+    Safe to call more than once (also registered with atexit).
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger for a specific module.
@@ -116,7 +158,8 @@ class LoggerMixin:
     Mixin class to add logging capability to any class.
     
     Provides a self.logger attribute that can be used for logging.
-    The logger name is automatically set to the class name.
+    The logger name is automatically set to the class name, and the
+    logger is resolved once per class and cached on it.
     
     Example:
         >>> class MyService(LoggerMixin):
@@ -124,7 +167,17 @@ class LoggerMixin:
         ...         self.logger.info("Processing...")
     """
     
+    @classmethod
+    def _class_logger(cls) -> logging.Logger:
+        """Get (and cache on the class) the logger named after cls."""
+        # Look in cls.__dict__, not via inheritance, so subclasses get their own
+        cached = cls.__dict__.get("_cached_logger")
+        if cached is None:
+            cached = get_logger(cls.__name__)
+            cls._cached_logger = cached
+        return cached
+    
     @property
     def logger(self) -> logging.Logger:
         """Get logger named after this class."""
-        return get_logger(self.__class__.__name__)
+        return type(self)._class_logger()
@@ -8,20 +8,29 @@ This module provides simple in-memory rate limiting to:
 
 For production with multiple instances, upgrade to Redis-backed limiter.
 """
-from datetime import datetime, timedelta
 from typing import Dict, List, Tuple
+import heapq
+import logging
 import threading
+import time
 
 from src.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Buckets are spread over this many independently locked shards so
+# concurrent requests for different sessions rarely contend (power of 2)
+NUM_SHARDS = 16
+
 
 class RateLimiter:
     """
-    Simple sliding window rate limiter.
+    Token-bucket rate limiter.
     
-    Tracks requests per session_id within a time window.
+    Each session_id gets a bucket holding up to `requests_per_minute`
+    tokens, refilled continuously at requests_per_minute / 60 tokens per
+    second. A request consumes one token. Time is measured with
+    time.monotonic() so wall-clock jumps cannot reset or freeze limits.
     
     Example:
         >>> limiter = RateLimiter(requests_per_minute=30)
@@ -43,14 +52,29 @@ class RateLimiter:
             cleanup_interval_minutes: How often to clean old entries
         """
         self.limit = requests_per_minute
-        self.window = timedelta(minutes=1)
-        self.cleanup_interval = timedelta(minutes=cleanup_interval_minutes)
+        # Window and intervals are in seconds
+        self.window = 60.0
+        self.rate = requests_per_minute / self.window
+        self.cleanup_interval = cleanup_interval_minutes * 60.0
         
-        self._requests: Dict[str, List[datetime]] = {}
-        self._lock = threading.RLock()
-        self._last_cleanup = datetime.utcnow()
+        # identifier -> [tokens, last_refill (monotonic)], sharded by hash
+        self._shards: List[Dict[str, List[float]]] = [{} for _ in range(NUM_SHARDS)]
+        # Per-shard min-heaps of (earliest possible expiry, identifier); exactly
+        # one entry per bucket, so cleanup only visits buckets that may be idle
+        self._heaps: List[List[Tuple[float, str]]] = [[] for _ in range(NUM_SHARDS)]
+        self._locks = [threading.Lock() for _ in range(NUM_SHARDS)]
+        self._last_cleanup = time.monotonic()
+        # Held by whichever request is sweeping; others skip instead of waiting
+        self._cleanup_lock = threading.Lock()
         
-        logger.info(f"RateLimiter initialized: {requests_per_minute} requests/minute")
+        logger.info("RateLimiter initialized: %d requests/minute", requests_per_minute)
+    
+    def _refill(self, bucket: List[float], now: float) -> float:
+        """Top up a bucket for the time elapsed since its last refill."""
+        tokens = min(self.limit, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[0] = tokens
+        bucket[1] = now
+        return tokens
     
     def is_allowed(self, identifier: str) -> Tuple[bool, int]:
         """
@@ -58,35 +82,30 @@ class RateLimiter:
         
         Args:
             identifier: Session ID or IP address
-            
+        
         Returns:
             Tuple of (is_allowed, remaining_requests)
         """
-        with self._lock:
-            self._maybe_cleanup()
-            
-            now = datetime.utcnow()
-            cutoff = now - self.window
-            
-            # Get existing requests for this identifier
-            if identifier not in self._requests:
-                self._requests[identifier] = []
-            
-            # Filter to only requests within the window
-            recent = [t for t in self._requests[identifier] if t > cutoff]
-            self._requests[identifier] = recent
-            
-            # Check limit
-            remaining = max(0, self.limit - len(recent))
+        now = time.monotonic()
+        if now - self._last_cleanup >= self.cleanup_interval:
+            self._cleanup(now)
+        
+        idx = hash(identifier) & (NUM_SHARDS - 1)
+        with self._locks[idx]:
+            shard = self._shards[idx]
+            bucket = shard.get(identifier)
+            if bucket is None:
+                # New identifiers start with a full bucket
+                bucket = shard[identifier] = [float(self.limit), now]
+                heapq.heappush(self._heaps[idx], (now + self.window, identifier))
             
-            if len(recent) >= self.limit:
-                logger.warning(f"Rate limit exceeded for: {identifier[:8]}...")
+            tokens = self._refill(bucket, now)
+            if tokens < 1:
+                logger.warning("Rate limit exceeded for: %.8s...", identifier)
                 return False, 0
             
-            # Record this request
-            self._requests[identifier].append(now)
-            
-            return True, remaining - 1
+            bucket[0] = tokens - 1
+            return True, int(tokens - 1)
     
     def get_remaining(self, identifier: str) -> int:
         """
@@ -94,57 +113,74 @@ class RateLimiter:
         
         Args:
             identifier: Session ID or IP address
-            
+        
         Returns:
-            Number of remaining requests in current window
+            Number of requests currently available
         """
-        with self._lock:
-            now = datetime.utcnow()
-            cutoff = now - self.window
-            
-            if identifier not in self._requests:
+        idx = hash(identifier) & (NUM_SHARDS - 1)
+        with self._locks[idx]:
+            bucket = self._shards[idx].get(identifier)
+            if bucket is None:
                 return self.limit
-            
-            recent = [t for t in self._requests[identifier] if t > cutoff]
-            return max(0, self.limit - len(recent))
+            return int(self._refill(bucket, time.monotonic()))
     
-    def get_reset_time(self, identifier: str) -> datetime:
+    def get_reset_time(self, identifier: str) -> float:
         """
-        Get when the rate limit resets for an identifier.
+        Get when the next request will be allowed for an identifier.
         
         Args:
             identifier: Session ID or IP address
-            
+        
         Returns:
-            Datetime when oldest request expires
+            Epoch timestamp (seconds) when a token is next available
         """
-        with self._lock:
-            if identifier not in self._requests or not self._requests[identifier]:
-                return datetime.utcnow()
+        idx = hash(identifier) & (NUM_SHARDS - 1)
+        with self._locks[idx]:
+            bucket = self._shards[idx].get(identifier)
+            if bucket is None:
+                return time.time()
             
-            oldest = min(self._requests[identifier])
-            return oldest + self.window
+            tokens = self._refill(bucket, time.monotonic())
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+            return time.time() + wait
     
-    def _maybe_cleanup(self) -> None:
-        """Remove old entries periodically."""
-        now = datetime.utcnow()
-        
-        if now - self._last_cleanup < self.cleanup_interval:
+    def _cleanup(self, now: float) -> None:
+        """Drop buckets idle long enough to have refilled completely."""
+        # Only one request sweeps; concurrent callers that also saw the
+        # interval elapse go straight on to their own shard
+        if not self._cleanup_lock.acquire(blocking=False):
             return
+        try:
+            if now - self._last_cleanup < self.cleanup_interval:
+                return
+            self._last_cleanup = now
+            self._sweep(now)
+        finally:
+            self._cleanup_lock.release()
+    
+    def _sweep(self, now: float) -> None:
+        """
+        Remove idle buckets shard by shard (one shard lock held at a time).
         
-        cutoff = now - self.window
-        
-        # Remove old timestamps
-        for identifier in list(self._requests.keys()):
-            self._requests[identifier] = [
-                t for t in self._requests[identifier] if t > cutoff
-            ]
-            # Remove empty entries
-            if not self._requests[identifier]:
-                del self._requests[identifier]
+        Only heap entries whose expiry has passed are examined: a bucket
+        that was used since it was queued is re-queued at its new expiry,
+        otherwise it is dropped. Work is O(k log n) for k due entries
+        rather than a scan of every bucket.
+        """
+        for shard, heap, lock in zip(self._shards, self._heaps, self._locks):
+            with lock:
+                while heap and heap[0][0] <= now:
+                    _, identifier = heapq.heappop(heap)
+                    last = shard[identifier][1]
+                    if now - last >= self.window:
+                        del shard[identifier]
+                    else:
+                        heapq.heappush(heap, (last + self.window, identifier))
         
-        self._last_cleanup = now
-        logger.debug(f"Rate limiter cleanup: {len(self._requests)} active sessions")
+        # Counting walks every shard, so only do it when DEBUG is on
+        if logger.isEnabledFor(logging.DEBUG):
+            active = sum(len(shard) for shard in self._shards)
+            logger.debug("Rate limiter cleanup: %d active sessions", active)
 
 
 # Global rate limiter instance
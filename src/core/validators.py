@@ -30,8 +30,20 @@ SUSPICIOUS_PATTERNS = [
 # Compiled patterns for efficiency
 _SUSPICIOUS_REGEX = [re.compile(p, re.IGNORECASE) for p in SUSPICIOUS_PATTERNS]
 
+# Canonical hyphenated UUID; anything else falls back to uuid.UUID parsing
+_UUID_RE = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
 
-def sanitize_message(message: str, max_length: int = 2000) -> str:
+# Deletes null bytes in a single str.translate pass
+_NULL_BYTES_TABLE = str.maketrans("", "", "\x00")
+
+VALID_MODES = frozenset({'sql', 'chat'})
+
+MAX_MESSAGE_LENGTH = 2000
+
+
+def sanitize_message(message: str, max_length: int = MAX_MESSAGE_LENGTH) -> str:
     """
     Sanitize a user message.
     
@@ -50,14 +62,9 @@ def sanitize_message(message: str, max_length: int = 2000) -> str:
     if not message:
         return ""
     
-    # Remove null bytes
-    cleaned = message.replace("\x00", "")
-    
-    # Strip whitespace
-    cleaned = cleaned.strip()
-    
-    # Normalize excessive whitespace
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    # Remove null bytes, then strip and collapse whitespace runs in one go
+    # (str.split() without arguments drops leading/trailing whitespace)
+    cleaned = " ".join(message.translate(_NULL_BYTES_TABLE).split())
     
     # Limit length
     if len(cleaned) > max_length:
@@ -79,6 +86,9 @@ def validate_session_id(session_id: str) -> Tuple[bool, Optional[str]]:
     if not session_id:
         return True, None  # Empty is OK (will be generated)
     
+    if _UUID_RE.fullmatch(session_id):
+        return True, None
+    
     try:
         # Attempt to parse as UUID
         uuid.UUID(session_id)
@@ -135,8 +145,8 @@ def validate_message(message: str) -> Tuple[bool, str, Optional[str]]:
     if len(sanitized) < 1:
         return False, "", "Message too short"
     
-    if len(sanitized) > 2000:
-        return False, "", "Message too long (max 2000 characters)"
+    if len(sanitized) > MAX_MESSAGE_LENGTH:
+        return False, "", f"Message too long (max {MAX_MESSAGE_LENGTH} characters)"
     
     # Check for suspicious patterns (warning only, don't block)
     is_suspicious, pattern = detect_suspicious_patterns(sanitized)
@@ -156,9 +166,43 @@ def validate_mode(mode: str) -> Tuple[bool, Optional[str]]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    valid_modes = {'sql', 'chat'}
-    
-    if mode not in valid_modes:
-        return False, f"Invalid mode: {mode}. Must be one of: {valid_modes}"
+    if mode not in VALID_MODES:
+        return False, f"Invalid mode: {mode}. Must be one of: {set(VALID_MODES)}"
     
     return True, None
+
+
+def validate_chat_input(
+    message: str,
+    session_id: Optional[str],
+    mode: str
+) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Validate a chat request's session_id, message and mode in one call.
+    
+    Equivalent to validate_session_id + validate_message + validate_mode
+    (checked in that order), but stops at the first failure and only
+    sanitizes the message once.
+    
+    Args:
+        message: Raw user message
+        session_id: Optional session ID (skipped when empty)
+        mode: Query mode ('sql' or 'chat')
+        
+    Returns:
+        Tuple of (sanitized_message, error_message, invalid_field);
+        error_message and invalid_field are None when everything is valid
+    """
+    # validate_session_id already takes the regex fast path (and accepts empty)
+    is_valid, error = validate_session_id(session_id)
+    if not is_valid:
+        return "", error, "session_id"
+    
+    is_valid, sanitized, error = validate_message(message)
+    if not is_valid:
+        return "", error, "message"
+    
+    if mode not in VALID_MODES:
+        return "", f"Invalid mode: {mode}. Must be one of: {set(VALID_MODES)}", "mode"
+    
+    return sanitized, None, None
@@ -20,8 +20,8 @@ from src.database.session_helper import (
     ensure_default_connection,
     get_session_components
 )
-from src.database.schema import SchemaInspector, TableInfo, ColumnInfo
-from src.database.loader import CSVLoader
+from src.database.schema import SchemaInspector, TableInfo, ColumnInfo, SchemaCache, get_schema_cache
+from src.database.loader import CSVLoader, sanitize_name
 from src.database.executor import QueryExecutor, QueryResult
 from src.database.validator import SQLValidator, ValidationResult
 from src.database.models import ConversationSession, ConversationMessage, Base
@@ -43,8 +43,11 @@ __all__ = [
     "SchemaInspector",
     "TableInfo",
     "ColumnInfo",
+    "SchemaCache",
+    "get_schema_cache",
     # Loader
     "CSVLoader",
+    "sanitize_name",
     # Executor
     "QueryExecutor",
     "QueryResult",
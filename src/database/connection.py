@@ -25,6 +25,14 @@ from src.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Pool sizing for the default engine. Sized for concurrent request handlers
+# (threadpool + parallel CSV loads); pool_timeout fails fast instead of letting
+# requests queue behind an exhausted pool.
+POOL_SIZE = 20
+MAX_OVERFLOW = 10
+POOL_TIMEOUT_SECONDS = 5
+POOL_RECYCLE_SECONDS = 3600
+
 
 class DatabaseConnection:
     """
@@ -57,11 +65,15 @@ class DatabaseConnection:
         # pool_pre_ping: Test connections before using (handles stale connections)
         # pool_size: Number of connections to keep open
         # max_overflow: Additional connections allowed under load
+        # pool_timeout: Seconds to wait for a free connection before failing
+        # pool_recycle: Replace connections older than this (server-side timeouts)
         self.engine = create_engine(
             db_url,
             pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
+            pool_size=POOL_SIZE,
+            max_overflow=MAX_OVERFLOW,
+            pool_timeout=POOL_TIMEOUT_SECONDS,
+            pool_recycle=POOL_RECYCLE_SECONDS,
             echo=False,  # Set True to log all SQL (very verbose)
         )
         
@@ -197,6 +197,7 @@ class SessionConnectionManager:
                     pool_pre_ping=True,
                     pool_size=3,
                     max_overflow=5,
+                    pool_timeout=5,  # Fail fast instead of queueing on a busy pool
                     pool_recycle=3600,  # Recycle connections after 1 hour
                     echo=False
                 )
@@ -9,9 +9,12 @@ Key optimizations:
 5. Schema inference from first N rows only
 6. UTF-8 BOM handling
 """
+import asyncio
 import csv
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Iterator
+from typing import Dict, List, Any, Optional, Iterator, Tuple
 from io import StringIO
 import re
 
@@ -26,6 +29,15 @@ logger = get_logger(__name__)
 # Optimized settings
 BATCH_SIZE = 5000  # Larger batches = fewer DB round-trips
 SAMPLE_SIZE = 100  # Rows to sample for type inference
+LOAD_CONCURRENCY = 4  # Files loaded in parallel (stays well below the pool size)
+
+# Spaces and hyphens in file/column names become underscores (one translate pass)
+_NAME_TRANSLATION = str.maketrans(" -", "__")
+
+
+def sanitize_name(name: str) -> str:
+    """Lowercase a file stem or header and replace spaces/hyphens with underscores."""
+    return name.lower().translate(_NAME_TRANSLATION)
 
 
 class CSVLoader:
@@ -50,6 +62,8 @@ class CSVLoader:
         self.db = db_connection if db_connection is not None else get_database()
         self.data_dir = data_dir or Path(__file__).parent.parent.parent / "data"
         self.metadata = MetaData()
+        # Parallel loads define tables on the shared MetaData from several threads
+        self._metadata_lock = threading.Lock()
         logger.info(f"CSVLoader initialized: data_dir={self.data_dir}")
     
     def load_file(
@@ -82,7 +96,7 @@ class CSVLoader:
             # Remove everything in parentheses, brackets, etc.
             raw_name = re.sub(r'[\(\)\[\]\{\}]', '', raw_name)
             # Replace spaces, hyphens with underscores
-            raw_name = raw_name.replace(" ", "_").replace("-", "_")
+            raw_name = raw_name.translate(_NAME_TRANSLATION)
             # Remove any remaining special characters
             table_name = re.sub(r'[^a-z0-9_]', '', raw_name)
             # Ensure it doesn't start with a number
@@ -111,30 +125,72 @@ class CSVLoader:
         logger.info(f"✓ Loaded {row_count:,} rows into '{table_name}'")
         return row_count
     
-    def load_all_csvs(self, drop_existing: bool = True) -> Dict[str, int]:
-        """Load all CSV files from the data directory."""
-        results = {}
+    def load_all_csvs(
+        self,
+        drop_existing: bool = True,
+        max_workers: int = LOAD_CONCURRENCY
+    ) -> Dict[str, int]:
+        """
+        Load all CSV files from the data directory.
+        
+        Files go to separate tables, so they are loaded on a thread pool
+        (parsing one file overlaps with inserts for another).
+        
+        Args:
+            drop_existing: Drop existing tables before loading
+            max_workers: Maximum files loaded at once (keep below pool size)
+            
+        Returns:
+            Mapping of table name to rows loaded (-1 on failure)
+        """
         csv_files = list(self.data_dir.glob("*.csv"))
         
         if not csv_files:
             logger.warning(f"No CSV files found in {self.data_dir}")
-            return results
+            return {}
         
-        logger.info(f"Found {len(csv_files)} CSV files to load")
+        workers = max(1, min(max_workers, len(csv_files)))
+        logger.info(f"Found {len(csv_files)} CSV files to load ({workers} at a time)")
         
-        for csv_file in csv_files:
-            try:
-                table_name = csv_file.stem.lower().replace(" ", "_").replace("-", "_")
-                row_count = self.load_file(csv_file, table_name, drop_existing)
-                results[table_name] = row_count
-            except Exception as e:
-                logger.error(f"Failed to load {csv_file.name}: {e}")
-                results[csv_file.stem] = -1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="csv-load") as executor:
+            # map keeps file order, so results match a sequential load
+            results = dict(executor.map(
+                lambda csv_file: self._load_one(csv_file, drop_existing),
+                csv_files
+            ))
         
         total = sum(v for v in results.values() if v > 0)
         logger.info(f"CSV loading complete: {total:,} total rows")
         return results
     
+    async def load_all_csvs_async(
+        self,
+        drop_existing: bool = True,
+        max_concurrency: int = LOAD_CONCURRENCY
+    ) -> Dict[str, int]:
+        """
+        Load all CSV files from the data directory without blocking the event loop.
+        
+        Runs load_all_csvs (and its thread pool) in a worker thread.
+        
+        Args:
+            drop_existing: Drop existing tables before loading
+            max_concurrency: Maximum files loaded at once (keep below pool size)
+            
+        Returns:
+            Mapping of table name to rows loaded (-1 on failure)
+        """
+        return await asyncio.to_thread(self.load_all_csvs, drop_existing, max_concurrency)
+    
+    def _load_one(self, csv_file: Path, drop_existing: bool) -> Tuple[str, int]:
+        """Load one file for load_all_csvs, returning (table_name, rows or -1)."""
+        try:
+            table_name = sanitize_name(csv_file.stem)
+            return table_name, self.load_file(csv_file, table_name, drop_existing)
+        except Exception as e:
+            logger.error(f"Failed to load {csv_file.name}: {e}")
+            return csv_file.stem, -1
+    
     def _read_headers_and_sample(
         self, 
         file_path: Path
@@ -235,7 +291,7 @@ class CSVLoader:
                 if not col_name or not col_name.strip():
                     continue
                 
-                safe_name = col_name.lower().replace(" ", "_").replace("-", "_")
+                safe_name = sanitize_name(col_name)
                 if not safe_name:
                     safe_name = f"col_{len(columns)}"
                 
@@ -248,7 +304,13 @@ class CSVLoader:
             if not columns:
                 raise ValueError("No valid columns to create")
             
-            table = Table(table_name, self.metadata, *columns, extend_existing=True)
+            with self._metadata_lock:
+                # Loaders are reused across requests; drop any stale definition so
+                # a re-created table doesn't inherit columns from an earlier file
+                stale = self.metadata.tables.get(table_name)
+                if stale is not None:
+                    self.metadata.remove(stale)
+                table = Table(table_name, self.metadata, *columns, extend_existing=True)
             table.create(self.db.engine, checkfirst=True)
             
             logger.info(f"Created table '{table_name}' with {len(columns)} columns")
@@ -263,7 +325,7 @@ class CSVLoader:
         """Stream CSV and insert in batches."""
         # Build column mapping
         header_mapping = {
-            h: h.lower().replace(" ", "_").replace("-", "_")
+            h: sanitize_name(h)
             for h in headers
             if h and h.strip()
         }
@@ -11,10 +11,13 @@ This metadata is used to:
 2. Validate generated SQL against allowed tables/columns
 3. Provide schema information to users
 """
-from typing import Dict, List, Any
+import threading
+import time
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
 from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 
 from src.database.connection import get_database
@@ -22,6 +25,10 @@ from src.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Per-session schema results are reused for this many seconds
+SCHEMA_CACHE_TTL_SECONDS = 60
+SCHEMA_CACHE_MAX_ENTRIES = 256
+
 
 @dataclass
 class ColumnInfo:
@@ -66,9 +73,15 @@ class SchemaInspector:
         Initialize schema inspector.
         
         Args:
-            db_connection: Optional DatabaseConnection instance. If not provided, uses default.
+            db_connection: Optional DatabaseConnection instance, or an existing
+                SQLAlchemy Engine (e.g. a session's pooled engine) to inspect
+                without opening a new one. If not provided, uses default.
         """
         from src.database.connection import get_database
+        from src.database.session_helper import SessionDatabaseConnection
+        
+        if isinstance(db_connection, Engine):
+            db_connection = SessionDatabaseConnection(db_connection)
         self.db = db_connection if db_connection is not None else get_database()
         logger.info("SchemaInspector initialized")
     
@@ -88,6 +101,25 @@ class SchemaInspector:
             logger.error(f"Failed to get table names: {e}")
             raise
     
+    def table_exists(self, table_name: str) -> bool:
+        """
+        Check whether a single table exists.
+        
+        Uses the dialect's has_table lookup (one catalog query) instead of
+        reflecting every table name just to test membership.
+        
+        Args:
+            table_name: Name of the table to look for
+            
+        Returns:
+            True if the table exists
+        """
+        try:
+            return inspect(self.db.engine).has_table(table_name)
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to check table '{table_name}': {e}")
+            raise
+    
     def get_table_info(self, table_name: str) -> TableInfo:
         """
         Get detailed information about a specific table.
@@ -259,3 +291,103 @@ class SchemaInspector:
                 lines.append(col_desc)
         
         return "\n".join(lines)
+
+
+class SchemaCache:
+    """
+    Small TTL cache of schema inspection results, keyed by session ID.
+    
+    Stores the table name list (from /connection/connect), the full
+    TableInfo list and the serialized /database/schema response body with
+    its ETag, so repeated calls skip the information_schema round-trips (and,
+    for the body, response building and encoding). Entries expire after `ttl` seconds
+    and must be invalidated whenever a session's tables change.
+    """
+    
+    def __init__(
+        self,
+        ttl: float = SCHEMA_CACHE_TTL_SECONDS,
+        maxsize: int = SCHEMA_CACHE_MAX_ENTRIES
+    ):
+        """
+        Initialize the cache.
+        
+        Args:
+            ttl: Seconds an entry stays valid
+            maxsize: Maximum number of sessions kept (oldest evicted first)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # session_id -> {"expires_at": float, "table_names": [...], "tables": [...]}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def _get(self, session_id: str, field_name: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            if entry["expires_at"] <= time.monotonic():
+                del self._entries[session_id]
+                return None
+            return entry.get(field_name)
+    
+    def _set(self, session_id: str, field_name: str, value: Any) -> None:
+        with self._lock:
+            now = time.monotonic()
+            entry = self._entries.get(session_id)
+            if entry is None or entry["expires_at"] <= now:
+                if session_id not in self._entries and len(self._entries) >= self.maxsize:
+                    # Evict the oldest session (dicts keep insertion order)
+                    self._entries.pop(next(iter(self._entries)))
+                entry = self._entries[session_id] = {"expires_at": now + self.ttl}
+            entry[field_name] = value
+    
+    def get_table_names(self, session_id: str) -> Optional[List[str]]:
+        """Get cached table names for a session, or None on a miss."""
+        return self._get(session_id, "table_names")
+    
+    def set_table_names(self, session_id: str, table_names: List[str]) -> None:
+        """Cache table names for a session."""
+        self._set(session_id, "table_names", table_names)
+    
+    def get_tables(self, session_id: str) -> Optional[List[TableInfo]]:
+        """Get cached TableInfo list for a session, or None on a miss."""
+        return self._get(session_id, "tables")
+    
+    def set_tables(self, session_id: str, tables: List[TableInfo]) -> None:
+        """Cache the TableInfo list for a session."""
+        self._set(session_id, "tables", tables)
+    
+    def get_response(self, session_id: str) -> Optional[Tuple[bytes, str]]:
+        """Get the cached /database/schema (body, etag) pair, or None."""
+        return self._get(session_id, "response")
+    
+    def set_response(self, session_id: str, body: bytes, etag: str) -> None:
+        """Cache the serialized /database/schema response and its ETag."""
+        self._set(session_id, "response", (body, etag))
+    
+    def invalidate(self, session_id: Optional[str] = None) -> None:
+        """
+        Drop cached schema for a session, or for all sessions if None.
+        
+        Args:
+            session_id: Session whose tables changed (None clears everything)
+        """
+        with self._lock:
+            if session_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(session_id, None)
+
+
+# Global schema cache instance
+_schema_cache: Optional[SchemaCache] = None
+
+
+def get_schema_cache() -> SchemaCache:
+    """Get or create the global schema cache."""
+    global _schema_cache
+    if _schema_cache is None:
+        _schema_cache = SchemaCache()
+    return _schema_cache
@@ -6,12 +6,49 @@ This module provides helper functions to:
 - Retrieve session-specific database connections
 - Manage connection lifecycle
 """
-from typing import Optional, Tuple
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Optional, Tuple
+
+from sqlalchemy.orm import sessionmaker
+
 from src.core.config import get_settings
 from src.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Per-session component sets kept around for reuse (least recently used evicted)
+SESSION_COMPONENTS_MAX_ENTRIES = 512
+
+# session_id -> (engine, (db_conn, inspector, executor, loader))
+_components_cache: "OrderedDict[str, Tuple[Any, Tuple]]" = OrderedDict()
+_components_lock = threading.Lock()
+
+
+class SessionDatabaseConnection:
+    """Wrapper for session engine to match DatabaseConnection interface."""
+    def __init__(self, engine):
+        self.engine = engine
+        self.settings = get_settings()
+        self._session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    
+    def get_session(self):
+        """Return session context manager."""
+        @contextmanager
+        def _get_session():
+            session = self._session_factory()
+            try:
+                yield session
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+            finally:
+                session.close()
+        
+        return _get_session()
+
 
 def ensure_default_connection(session_id: str) -> Tuple[bool, str]:
     """
@@ -150,6 +187,9 @@ def get_session_components(session_id: str):
     Get database components for a session (inspector, executor, loader).
     Does NOT auto-connect - returns None if no connection exists.
     
+    Components are cached per session and reused while the session keeps
+    the same engine; reconnecting (new engine) rebuilds them.
+    
     Args:
         session_id: Session identifier
         
@@ -171,65 +211,29 @@ def get_session_components(session_id: str):
     
     if engine is None:
         logger.debug(f"No connection found for session {session_id}")
+        with _components_lock:
+            _components_cache.pop(session_id, None)
         return None, None, None, None
     
-    if engine is None:
-        return None, None, None, None
-    
-    # Get connection info to reconstruct URL
-    conn_info = manager.get_connection_info(session_id)
-    if not conn_info:
-        return None, None, None, None
+    with _components_lock:
+        cached = _components_cache.get(session_id)
+        if cached is not None and cached[0] is engine:
+            _components_cache.move_to_end(session_id)
+            return cached[1]
     
-    # Reconstruct database URL
-    db_type = conn_info["db_type"]
-    username = conn_info["username"]
-    # Note: Password is not stored in conn_info for security
-    # We need to get it from the manager's internal credentials
-    # For now, we'll create a new DatabaseConnection using the existing engine
-    # This is done by passing the connection URL
-    
-    # Actually, let's use a better approach - create DatabaseConnection from existing engine
-    # We can't easily do this, so instead we'll create wrapper instances
-    # that use the session's engine
-    
-    # Create a temporary DatabaseConnection with the engine
-    # This requires modifying our approach slightly
-    
-    # Create components using a mock connection that wraps the engine
-    class SessionDatabaseConnection:
-        """Wrapper for session engine to match DatabaseConnection interface."""
-        def __init__(self, engine):
-            self.engine = engine
-            self.settings = get_settings()
-        
-        def get_session(self):
-            """Return session context manager."""
-            from contextlib import contextmanager
-            from sqlalchemy.orm import sessionmaker
-            
-            SessionLocal = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
-            
-            @contextmanager
-            def _get_session():
-                session = SessionLocal()
-                try:
-                    yield session
-                    session.commit()
-                except Exception:
-                    session.rollback()
-                    raise
-                finally:
-                    session.close()
-            
-            return _get_session()
-    
-    # Create wrapper
+    # Wrap the session's engine to match the DatabaseConnection interface
     db_conn = SessionDatabaseConnection(engine)
     
     # Create components
     inspector = SchemaInspector(db_conn)
     executor = QueryExecutor(db_conn)
     loader = CSVLoader(db_connection=db_conn)
+    components = (db_conn, inspector, executor, loader)
+    
+    with _components_lock:
+        _components_cache[session_id] = (engine, components)
+        _components_cache.move_to_end(session_id)
+        while len(_components_cache) > SESSION_COMPONENTS_MAX_ENTRIES:
+            _components_cache.popitem(last=False)
     
-    return db_conn, inspector, executor, loader
+    return components
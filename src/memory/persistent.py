@@ -19,6 +19,7 @@ from typing import Dict, Optional, List
 import threading
 import json
 
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from src.core.logging_config import get_logger
@@ -28,6 +29,20 @@ from src.memory.conversation import Message, ConversationMemory
 
 logger = get_logger(__name__)
 
+# Statements for the read-only session endpoints, built once at import.
+# Values are passed as bound parameters, so every call reuses the same
+# construct and hits the engine's compiled-statement cache.
+_SESSION_BY_ID = select(ConversationSession).where(
+    ConversationSession.id == bindparam("session_id")
+)
+_RECENT_SESSIONS = select(ConversationSession).order_by(
+    ConversationSession.last_activity.desc()
+).limit(bindparam("limit"))
+_FIRST_USER_MESSAGE = select(ConversationMessage.content).where(
+    ConversationMessage.session_id == bindparam("session_id"),
+    ConversationMessage.role == 'user'
+).order_by(ConversationMessage.timestamp.asc()).limit(1)
+
 
 class PersistentMemoryManager:
     """
@@ -267,8 +282,8 @@ class PersistentMemoryManager:
             Session info dict or None
         """
         with self.db.get_session() as db_session:
-            db_conv = db_session.query(ConversationSession).filter(
-                ConversationSession.id == session_id
+            db_conv = db_session.scalars(
+                _SESSION_BY_ID, {"session_id": session_id}
             ).first()
             
             if db_conv:
@@ -293,18 +308,13 @@ class PersistentMemoryManager:
             List of session info dicts
         """
         with self.db.get_session() as db_session:
-            sessions = db_session.query(ConversationSession).order_by(
-                ConversationSession.last_activity.desc()
-            ).limit(limit).all()
+            sessions = db_session.scalars(_RECENT_SESSIONS, {"limit": limit}).all()
             
             result = []
             for s in sessions:
                 s_dict = s.to_dict()
                 # Get first user message for preview
-                first_msg = db_session.query(ConversationMessage.content).filter(
-                    ConversationMessage.session_id == s.id,
-                    ConversationMessage.role == 'user'
-                ).order_by(ConversationMessage.timestamp.asc()).limit(1).scalar()
+                first_msg = db_session.scalar(_FIRST_USER_MESSAGE, {"session_id": s.id})
                 
                 # Truncate preview if too long
                 preview = first_msg if first_msg else "New Conversation"
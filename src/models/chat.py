@@ -20,6 +20,7 @@ class ChatRequest(BaseModel):
         message: The user's natural language question or statement.
         session_id: Optional session identifier for multi-turn conversations.
         mode: Query mode - 'chat' for general, 'sql' for database queries.
+        include_analysis: Run deep AI analysis on SQL results.
     """
     message: str = Field(
         ...,
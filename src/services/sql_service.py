@@ -104,7 +104,8 @@ class SQLService:
         self,
         memory_manager: Optional[MemoryManager] = None,
         executor: Optional[QueryExecutor] = None,
-        schema_inspector: Optional[SchemaInspector] = None
+        schema_inspector: Optional[SchemaInspector] = None,
+        table_names: Optional[List[str]] = None
     ):
         """
         Initialize SQL service with required components.
@@ -114,6 +115,8 @@ class SQLService:
                           Uses global singleton if not provided.
             executor: Optional QueryExecutor instance for session-specific execution.
             schema_inspector: Optional SchemaInspector instance for session-specific schema.
+            table_names: Optional known table names (e.g. from the schema cache).
+                         Reflected through schema_inspector if not provided.
         """
         self.llm = LLMClient()
         self.settings = get_settings()
@@ -129,8 +132,10 @@ class SQLService:
         self.query_classifier = QueryClassifier()
         self.decomposer = QueryDecomposer()
         
-        # Get allowed tables from database
-        self.allowed_tables = set(self.schema_inspector.get_table_names())
+        # Get allowed tables from database (unless the caller already has them)
+        if table_names is None:
+            table_names = self.schema_inspector.get_table_names()
+        self.allowed_tables = set(table_names)
         self.validator = SQLValidator(allowed_tables=self.allowed_tables)
         
         # Cache schema for prompts